@@ -0,0 +1,16 @@
+"""
+Numba shim — numba არ არის დაყენებული → njit no-op decorator-ია და
+NUMBA_AVAILABLE=False, რომ caller-ებმა NumPy fallback path აირჩიონ.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
\ No newline at end of file
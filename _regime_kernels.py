@@ -0,0 +1,137 @@
+"""
+Market regime numeric kernels (Numba)
+
+ყველა kernel-ს აქვს ცხადი signature → compile ხდება import-ზე (eager) და
+არა პირველ analyze_regime call-ზე; cache=True → შემდეგი process-ები
+compiled artefact-ს __pycache__-დან ტვირთავენ. numba არ არის → _njit shim,
+ფუნქციები უბრალო Python-ია და market_regime NumPy path-ს იყენებს.
+"""
+
+import math
+
+import numpy as np
+
+from _njit import njit, prange
+
+
+@njit(['f8(f8,f8,f8[::1])', 'f8(f8,f8,f4[::1])'], cache=True, fastmath=True)
+def _trend_strength_nb(price, ema200, returns):
+    """ბოლო 19 return-ის mean + clip ერთ loop-ში — დროებითი array-ების გარეშე"""
+    n = returns.shape[0]
+    momentum = 0.0
+    if n >= 19:
+        s = 0.0
+        for i in range(n - 19, n):
+            s += returns[i]
+        momentum = s / 19.0
+    trend = (price - ema200) / ema200 * 2.0 + momentum * 100.0
+    return -1.0 if trend < -1.0 else 1.0 if trend > 1.0 else trend
+
+
+@njit(['f8(f8[::1])', 'f8(f4[::1])'], cache=True, fastmath=True)
+def _vol_pct_nb(returns):
+    """
+    ერთი traversal: Welford mean/variance ყველა return-ზე და ცალკე ბოლო 20-ზე
+    → current/historical std ratio, [0, 100]-ში clip-ული. f4 input-ზეც
+    accumulator-ები f8-ია (cancellation-ის თავიდან ასაცილებლად)
+    """
+    n = returns.shape[0]
+    if n < 20:
+        return 50.0
+    m_all = m2_all = 0.0
+    m_tail = m2_tail = 0.0
+    c_all = c_tail = 0
+    for i in range(n):
+        r = returns[i]
+        c_all += 1
+        d = r - m_all
+        m_all += d / c_all
+        m2_all += d * (r - m_all)
+        if i >= n - 20:
+            c_tail += 1
+            d = r - m_tail
+            m_tail += d / c_tail
+            m2_tail += d * (r - m_tail)
+    hist = math.sqrt(m2_all / c_all)
+    cur = math.sqrt(m2_tail / c_tail)
+    p = cur / (hist + 1e-10) * 50.0
+    return 0.0 if p < 0.0 else 100.0 if p > 100.0 else p
+
+
+@njit(['b1(f8[::1],f8)', 'b1(f4[::1],f8)'], cache=True)
+def _structural_nb(returns, trend):
+    """ბოლო 49 return-იდან ტრენდის მიმართულებით > 60% (ანუ > 29) → structural"""
+    n = returns.shape[0]
+    if n < 49:
+        return True
+    c = 0
+    if trend > 0:
+        for i in range(n - 49, n):
+            if returns[i] > 0:
+                c += 1
+    else:
+        for i in range(n - 49, n):
+            if returns[i] < 0:
+                c += 1
+    return c > 29
+
+
+@njit('i1(f8,f8,b1,f8,f8,f8)', cache=True)
+def _classify_nb(trend, vol, structural, rsi, price, ema200):
+    """
+    _classify_regime-ის იგივე cascade → MarketRegime-ის რიგითი კოდი
+    (0 BULL_STRONG … 8 SPONTANEOUS_EVENT, იხ. _REGIME_BY_CODE)
+    """
+    if vol > 85:
+        return 5
+    if trend > 0.6 and structural:
+        return 0
+    elif trend > 0.3 and structural:
+        return 1
+    elif trend < -0.6 and structural:
+        return 2
+    elif trend < -0.3 and structural:
+        return 3
+    elif abs(trend) < 0.2:
+        if vol < 30:
+            return 6
+        else:
+            return 4
+    elif vol < 25 and abs(trend) < 0.3:
+        return 7
+    elif not structural:
+        return 8
+    else:
+        return 4
+
+@njit(
+    [
+        'Tuple((i1[::1],f8[::1],f8[::1],b1[::1]))(f8[::1],f8[:,::1],i8[::1],f8[::1],f8[::1])',
+        'Tuple((i1[::1],f8[::1],f8[::1],b1[::1]))(f8[::1],f4[:,::1],i8[::1],f8[::1],f8[::1])',
+    ],
+    parallel=True,
+    cache=True,
+)
+def _analyze_many_nb(prices, histories, lengths, rsis, ema200s):
+    """
+    N symbol ერთ call-ში. histories (N, W) — row i-ის ბოლო lengths[i] ელემენტია
+    რეალური ისტორია (მარცხნივ padding). აბრუნებს (codes, trend, vol, structural).
+    row-ები დამოუკიდებელია → prange, GIL-ის გარეშე ყველა core-ზე.
+    """
+    N, W = histories.shape
+    codes = np.empty(N, np.int8)
+    trend = np.empty(N)
+    vol = np.empty(N)
+    structural = np.empty(N, np.bool_)
+    for i in prange(N):
+        n = lengths[i]
+        ph = histories[i, W - n:]
+        m = n - 1 if n > 1 else 0
+        returns = np.empty(m, histories.dtype)
+        for j in range(m):
+            returns[j] = (ph[j + 1] - ph[j]) / ph[j]
+        trend[i] = _trend_strength_nb(prices[i], ema200s[i], returns)
+        vol[i] = _vol_pct_nb(returns)
+        structural[i] = _structural_nb(returns, trend[i])
+        codes[i] = _classify_nb(trend[i], vol[i], structural[i], rsis[i], prices[i], ema200s[i])
+    return codes, trend, vol, structural
@@ -0,0 +1,154 @@
+"""
+Market structure numeric kernels (Numba)
+
+იგივე პრინციპი რაც _regime_kernels-ში: ცხადი signature → eager compile
+import-ზე, cache=True → compiled artefact __pycache__-დან. numba არ არის →
+_njit shim და market_structure_builder NumPy path-ს იყენებს.
+ერთი symbol-ის kernel-ები nogil=True — build() thread-ებიდან (to_thread /
+executor) პარალელურად მუშაობს; batch kernel თვითონ prange-ით პარალელურია.
+ყველა kernel იღებს f4 ისტორიასაც — შედეგები და scalar-ები f8-ში რჩება.
+"""
+
+import numpy as np
+
+from _njit import njit, prange
+
+
+@njit(
+    ['Tuple((f8[::1],i8[::1]))(f8[::1],f8,b1)', 'Tuple((f8[::1],i8[::1]))(f4[::1],f8,b1)'],
+    cache=True, nogil=True,
+)
+def _sr_levels_nb(prices, current_price, find_min):
+    """
+    support (find_min) / resistance დონეები ერთ kernel-ში: ლოკალური min/max
+    ±window ფანჯარაში, current_price-ის ქვემოთ/ზემოთ, ≤5 უახლოესი (stable),
+    შემდეგ touches (ფასები ±1.5%-ში) მხოლოდ არჩეულ დონეებზე.
+    """
+    n = prices.shape[0]
+    window = max(5, n // 20)
+    top = np.empty(5)
+    top_dist = np.empty(5)
+    k = 0
+    for i in range(window, n - window):
+        v = prices[i]
+        # v == min(window) — `not >=` რომ NaN ფანჯარა np.min-ის მსგავსად გამოირიცხოს
+        is_extremum = True
+        for j in range(i - window, i + window + 1):
+            if find_min:
+                if not prices[j] >= v:
+                    is_extremum = False
+                    break
+            elif not prices[j] <= v:
+                is_extremum = False
+                break
+        if not is_extremum:
+            continue
+        if find_min:
+            if not v < current_price:
+                continue
+        elif not v > current_price:
+            continue
+
+        # insertion top-5-ში distance-ით; თანაბარზე ძველი წინ რჩება
+        d = abs(v - current_price)
+        pos = k
+        while pos > 0 and top_dist[pos - 1] > d:
+            pos -= 1
+        if pos >= 5:
+            continue
+        last = k if k < 5 else 4
+        for t in range(last, pos, -1):
+            top[t] = top[t - 1]
+            top_dist[t] = top_dist[t - 1]
+        top[pos] = v
+        top_dist[pos] = d
+        if k < 5:
+            k += 1
+
+    levels = top[:k].copy()
+    touches = np.zeros(k, np.int64)
+    for i in range(n):
+        p = prices[i]
+        for t in range(k):
+            if abs(p - levels[t]) / levels[t] < 0.015:
+                touches[t] += 1
+    return levels, touches
+
+@njit(['Tuple((f8,i8,f8,i8))(f8[::1],f8)', 'Tuple((f8,i8,f8,i8))(f4[::1],f8)'], cache=True, nogil=True)
+def _nearest_sr_nb(prices, current_price):
+    """
+    build()-ისთვის: უახლოესი support და resistance + მათი touches ერთ kernel-ში.
+    ერთი window scan ორივე extremum-ს ამოწმებს; დონე არ არის → price*0.97 /
+    price*1.03 და touches=1 (იგივე default-ები რაც _find_*_levels-ში).
+    """
+    n = prices.shape[0]
+    support = current_price * 0.97
+    resistance = current_price * 1.03
+    sup_found = False
+    res_found = False
+    if n >= 10:
+        window = max(5, n // 20)
+        sup_d = np.inf
+        res_d = np.inf
+        for i in range(window, n - window):
+            v = prices[i]
+            is_min = True
+            is_max = True
+            for j in range(i - window, i + window + 1):
+                p = prices[j]
+                if not p >= v:
+                    is_min = False
+                if not p <= v:
+                    is_max = False
+                if not (is_min or is_max):
+                    break
+            # მკაცრი `<` — თანაბარ მანძილზე პირველი დონე რჩება
+            if is_min and v < current_price:
+                d = abs(v - current_price)
+                if d < sup_d:
+                    sup_d = d
+                    support = v
+                    sup_found = True
+            if is_max and v > current_price:
+                d = abs(v - current_price)
+                if d < res_d:
+                    res_d = d
+                    resistance = v
+                    res_found = True
+
+    sup_touches = 0 if sup_found else 1
+    res_touches = 0 if res_found else 1
+    if sup_found or res_found:
+        for i in range(n):
+            p = prices[i]
+            if sup_found and abs(p - support) / support < 0.015:
+                sup_touches += 1
+            if res_found and abs(p - resistance) / resistance < 0.015:
+                res_touches += 1
+    return support, sup_touches, resistance, res_touches
+
+@njit(
+    [
+        'Tuple((f8[::1],i8[::1],f8[::1],i8[::1]))(f8[:,::1],i8[::1],f8[::1])',
+        'Tuple((f8[::1],i8[::1],f8[::1],i8[::1]))(f4[:,::1],i8[::1],f8[::1])',
+    ],
+    parallel=True,
+    cache=True,
+)
+def _nearest_sr_many_nb(histories, lengths, prices):
+    """
+    _nearest_sr_nb N symbol-ზე. histories (N, W) — row i-ის ბოლო lengths[i]
+    ელემენტია რეალური ისტორია (მარცხნივ padding); row-ები დამოუკიდებელია → prange.
+    """
+    N, W = histories.shape
+    support = np.empty(N)
+    sup_touches = np.empty(N, np.int64)
+    resistance = np.empty(N)
+    res_touches = np.empty(N, np.int64)
+    for i in prange(N):
+        s, st, r, rt = _nearest_sr_nb(histories[i, W - lengths[i]:], prices[i])
+        support[i] = s
+        sup_touches[i] = st
+        resistance[i] = r
+        res_touches[i] = rt
+    return support, sup_touches, resistance, res_touches
\ No newline at end of file
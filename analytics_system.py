@@ -239,40 +239,68 @@ class AnalyticsDatabase:
             conn.commit()
 
     def record_performance(self, signal_id: int, outcome: str,
-                          final_profit_pct: float, exit_reason: str):
+                          final_profit_pct: float, exit_reason: str,
+                          exit_time: Optional[str] = None):
         """
         სიგნალის საბოლოო შედეგის ჩაწერა
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Get signal details
-            cursor = conn.execute("""
-                SELECT symbol, strategy, entry_timestamp, entry_price,
-                       expected_profit_min, expected_profit_max, confidence_score
-                FROM signals WHERE id = ?
-            """, (signal_id,))
+        self.record_performance_many(
+            [(signal_id, outcome, final_profit_pct, exit_reason, exit_time)]
+        )
 
-            row = cursor.fetchone()
-            if not row:
-                logger.error(f"❌ Signal {signal_id} not found")
+    def record_performance_many(
+        self, records: List[Tuple[int, str, float, str, Optional[str]]]
+    ):
+        """
+        რამდენიმე შედეგი ერთ connection/transaction-ში:
+        records = [(signal_id, outcome, final_profit_pct, exit_reason, exit_time|None), ...]
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            perf_rows = []
+            for signal_id, outcome, final_profit_pct, exit_reason, exit_time in records:
+                # ერთი ცუდი record (broken timestamp) batch-ის დანარჩენს აღარ აგდებს
+                try:
+                    # Get signal details
+                    cursor = conn.execute("""
+                        SELECT symbol, strategy, entry_timestamp, entry_price,
+                               expected_profit_min, expected_profit_max, confidence_score
+                        FROM signals WHERE id = ?
+                    """, (signal_id,))
+
+                    row = cursor.fetchone()
+                    if not row:
+                        logger.error(f"❌ Signal {signal_id} not found")
+                        continue
+
+                    symbol, strategy, entry_time, entry_price, exp_min, exp_max, conf = row
+
+                    # Get max/min from price history
+                    cursor = conn.execute("""
+                        SELECT MAX(profit_pct), MIN(profit_pct)
+                        FROM price_history WHERE signal_id = ?
+                    """, (signal_id,))
+
+                    max_profit, min_loss = cursor.fetchone()
+
+                    # Calculate hold duration
+                    entry_dt = datetime.fromisoformat(entry_time)
+                    exit_dt = datetime.fromisoformat(exit_time) if exit_time else datetime.now()
+                    hold_hours = (exit_dt - entry_dt).total_seconds() / 3600
+
+                    perf_rows.append((
+                        signal_id, symbol, strategy, outcome, final_profit_pct,
+                        max_profit or 0, min_loss or 0,
+                        entry_time, exit_dt.isoformat(), hold_hours,
+                        exp_min, exp_max, conf, exit_reason
+                    ))
+                except Exception as e:
+                    logger.error(f"❌ Performance record {signal_id} skipped: {e}")
+
+            if not perf_rows:
                 return
 
-            symbol, strategy, entry_time, entry_price, exp_min, exp_max, conf = row
-
-            # Get max/min from price history
-            cursor = conn.execute("""
-                SELECT MAX(profit_pct), MIN(profit_pct)
-                FROM price_history WHERE signal_id = ?
-            """, (signal_id,))
-
-            max_profit, min_loss = cursor.fetchone()
-
-            # Calculate hold duration
-            entry_dt = datetime.fromisoformat(entry_time)
-            exit_dt = datetime.now()
-            hold_hours = (exit_dt - entry_dt).total_seconds() / 3600
-
             # Insert performance
-            conn.execute("""
+            conn.executemany("""
                 INSERT INTO performance (
                     signal_id, symbol, strategy, outcome, final_profit_pct,
                     max_profit_pct, min_loss_pct,
@@ -280,21 +308,17 @@ class AnalyticsDatabase:
                     expected_profit_min, expected_profit_max, confidence_score,
                     exit_reason
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                signal_id, symbol, strategy, outcome, final_profit_pct,
-                max_profit or 0, min_loss or 0,
-                entry_time, exit_dt.isoformat(), hold_hours,
-                exp_min, exp_max, conf, exit_reason
-            ))
+            """, perf_rows)
 
             # Update signal status
-            conn.execute("""
+            conn.executemany("""
                 UPDATE signals SET status = 'COMPLETED'
                 WHERE id = ?
-            """, (signal_id,))
+            """, [(r[0],) for r in perf_rows])
 
             conn.commit()
-            logger.info(f"✅ Performance recorded: {symbol} - {outcome} ({final_profit_pct:+.2f}%)")
+            for r in perf_rows:
+                logger.info(f"✅ Performance recorded: {r[1]} - {r[3]} ({r[4]:+.2f}%)")
 
     # ════════════════════════════════════════════════════════════
     # QUERY METHODS
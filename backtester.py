@@ -268,7 +268,7 @@ class Backtester:
 
                             regime = self.regime_detector.analyze_regime(
                                 symbol, price, window,
-                                rsi, ema200, bb_low, bb_high
+                                rsi, ema200, bb_low, bb_high, verbose=False
                             )
 
                             sig = strategy.analyze(
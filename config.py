@@ -310,13 +310,23 @@ GUIDE_FOOTER = "\n\n⚠️ DYOR — არ არის ფინანსურ
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
+# symbol → tier ერთხელ, import-ისას (list-ებზე linear scan აღარ ყოველ call-ზე);
+# reversed — symbol რამდენიმე tier-ში თუ არის, პირველი tier იგებს, როგორც ადრე
+_TIER_BY_SYMBOL = {
+    symbol: tier
+    for tier, symbols in reversed((
+        ("BLUE_CHIP",   TIER_1_BLUE_CHIPS),
+        ("HIGH_GROWTH", TIER_2_HIGH_GROWTH),
+        ("MEME",        TIER_3_MEME_COINS),
+        ("NARRATIVE",   TIER_4_NARRATIVE),
+        ("EMERGING",    TIER_5_EMERGING),
+    ))
+    for symbol in symbols
+}
+
+
 def get_tier(symbol: str) -> str:
-    if symbol in TIER_1_BLUE_CHIPS:   return "BLUE_CHIP"
-    if symbol in TIER_2_HIGH_GROWTH:  return "HIGH_GROWTH"
-    if symbol in TIER_3_MEME_COINS:   return "MEME"
-    if symbol in TIER_4_NARRATIVE:    return "NARRATIVE"
-    if symbol in TIER_5_EMERGING:     return "EMERGING"
-    return "BLUE_CHIP"
+    return _TIER_BY_SYMBOL.get(symbol, "BLUE_CHIP")
 
 
 def get_tier_risk(tier: str) -> dict:
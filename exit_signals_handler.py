@@ -5,6 +5,7 @@ v1.0 შენარჩუნებული: TARGET_HIT, STOP_LOSS, TIMEOUT, Ex
 """
 
 import logging
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, Dict
 from dataclasses import dataclass
@@ -12,6 +13,17 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# TIMEOUT — max hold საათებში strategy-ის მიხედვით (check-ზე ყოველ ჯერზე აღარ იქმნება)
+_MAX_HOLD_HOURS = {
+    "long_term":     504,   # 21 days
+    "swing":         240,   # 10 days
+    "scalping":      1,     # 1 hour
+    "opportunistic": 168,   # 7 days
+}
+
+# price_history symbol-ზე — WS stream ~1 tick/s-ს წერს, ამიტომ bounded (ძველები იშლება)
+_PRICE_HISTORY_LEN = 1000
+
 
 class ExitReason(Enum):
     TARGET_HIT    = "target_hit"
@@ -100,7 +112,7 @@ class ExitSignalsHandler:
             "trailing_stop":      stop_loss_price,  # will be updated dynamically
         }
 
-        self.price_history.setdefault(symbol, [])
+        self.price_history[symbol] = deque(maxlen=_PRICE_HISTORY_LEN)
         self.price_history[symbol].append({
             "price": entry_price, "time": entry_time, "type": "ENTRY"
         })
@@ -125,7 +137,10 @@ class ExitSignalsHandler:
         # ✅ P1/#5 — update trailing stop if active
         self._update_trailing_stop(pos, current_price)
 
-        self.price_history.setdefault(symbol, []).append({
+        history = self.price_history.get(symbol)
+        if history is None:
+            history = self.price_history[symbol] = deque(maxlen=_PRICE_HISTORY_LEN)
+        history.append({
             "price": current_price, "time": timestamp, "type": "UPDATE"
         })
 
@@ -201,17 +216,11 @@ class ExitSignalsHandler:
             return ExitReason.STOP_LOSS, current_price
 
         # 4. TIMEOUT
-        max_hold = {
-            "long_term":     504,   # 21 days
-            "swing":         240,   # 10 days
-            "scalping":      1,     # 1 hour
-            "opportunistic": 168,   # 7 days
-        }
         try:
             entry_dt  = datetime.fromisoformat(pos["entry_time"])
             curr_dt   = datetime.fromisoformat(current_time)
             hold_hrs  = (curr_dt - entry_dt).total_seconds() / 3600
-            max_hrs   = max_hold.get(pos["strategy_type"], 240)
+            max_hrs   = _MAX_HOLD_HOURS.get(pos["strategy_type"], 240)
             if hold_hrs > max_hrs:
                 logger.warning(f"⏰ {symbol} TIMEOUT: {hold_hrs:.1f}h / {max_hrs}h")
                 return ExitReason.TIMEOUT, current_price
@@ -318,6 +327,7 @@ class ExitSignalsHandler:
             "analysis":    exit_analysis,
         })
         del self.active_positions[symbol]
+        self.price_history.pop(symbol, None)
         logger.info(f"✅ Position closed: {symbol}")
 
     def get_exit_statistics(self) -> Dict:
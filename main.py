@@ -12,6 +12,13 @@ from datetime import datetime
 
 from config import validate_config, LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT
 
+# uvloop — libuv event loop (ნაკლები overhead თითო await/callback-ზე); არ არის → asyncio default
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 
 def setup_logging():
     fmt = logging.Formatter(
@@ -47,6 +54,7 @@ async def main():
     logger.info("=" * 65)
     logger.info("🚀 TRADE ALLY BOT v3.1 — PRODUCTION")
     logger.info(f"   Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"   Event loop: {'uvloop' if UVLOOP_AVAILABLE else 'asyncio'}")
     logger.info("=" * 65)
 
     if not validate_config():
@@ -101,11 +109,19 @@ async def main():
         import traceback
         logger.error(traceback.format_exc())
         sys.exit(1)
+    finally:
+        # long-lived aiohttp session-ები — თორემ shutdown-ზე "Unclosed client session"
+        monitor = engine.position_monitor
+        if monitor and monitor.price_stream:
+            await monitor.price_stream.stop()
+        if engine.data_provider:
+            await engine.data_provider.close()
 
 
 if __name__ == "__main__":
+    run = uvloop.run if UVLOOP_AVAILABLE else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         print("\n⏸️ Interrupted")
     except Exception as e:
@@ -13,17 +13,27 @@ v2.5 შენარჩუნებული:
 
 import asyncio
 import aiohttp
+import random
 import time
 import logging
 import numpy as np
-from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Optional, Dict, Any, List, Tuple, Set
+from dataclasses import dataclass, field, fields
 from enum import Enum
 import pandas as pd
 from ta.trend import EMAIndicator, MACD
 from ta.momentum import RSIIndicator
 from ta.volatility import BollingerBands
 
+from config import TIER_1_BLUE_CHIPS
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads   # orjson არ არის → stdlib (bytes-ს ორივე იღებს)
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,7 +66,7 @@ class MultiTFData:
     alignment_score:   float = 50.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketData:
     symbol:              str
     price:               float
@@ -78,17 +88,32 @@ class MarketData:
     prev_close:          float
     source:              str
     timestamp:           float
-    multi_tf:            MultiTFData = field(default_factory=MultiTFData)
+    # MultiTFData mutable-ია — hash/eq მხოლოდ primitive ველებზე
+    multi_tf:            MultiTFData = field(default_factory=MultiTFData, hash=False, compare=False)
     volume_missing:      bool = False   # P0/#2
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # asdict() deep-copies every field — all fields here are primitives
+        d = {n: getattr(self, n) for n in _MD_FIELDS}
+        d["multi_tf"] = {n: getattr(self.multi_tf, n) for n in _MTF_FIELDS}
+        return d
 
 
-@dataclass
+_MTF_FIELDS = tuple(f.name for f in fields(MultiTFData))
+_MD_FIELDS  = tuple(f.name for f in fields(MarketData))
+_NO_MAPPING = (None, None, None)
+
+
+def _f(v, fb: float) -> float:
+    """NaN → fallback. v != v მხოლოდ NaN-ზეა True — pd.isna-ს dispatch-ის გარეშე"""
+    v = float(v)
+    return fb if v != v else v
+
+
+@dataclass(slots=True)
 class CircuitBreakerState:
     failures:             int          = 0
-    last_failure_time:    float        = 0
+    last_failure_time:    float        = 0.0   # time.monotonic()
     status:               SourceStatus = SourceStatus.HEALTHY
     consecutive_failures: int          = 0
 
@@ -107,13 +132,19 @@ class MultiSourceDataProvider:
             return
         self._initialized = True
 
-        self.cache:     Dict[str, Tuple[MarketData, float]] = {}
+        self.cache:     Dict[str, Tuple[MarketData, float]] = {}   # (md, monotonic ts)
         self.cache_ttl: int = 240   # 4 წუთი — scan interval-ზე ნაკლები
 
+        # Indicator cache — same bars → same indicators, skip recompute
+        self._ind_cache:     Dict[Tuple, Dict] = {}
+        self._ind_cache_max: int = 256
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+
         # P0/#1 — preload tracking
         self.preloaded_symbols: set = set()
         self.preload_complete:  bool = False
-        self._preload_lock = asyncio.Lock()
+        self._preload_lock: Optional[asyncio.Lock] = None   # _ensure_ready() ქმნის
 
         # Real history stores
         self._real_history: Dict[str, List[float]] = {}   # 1h closes
@@ -134,7 +165,29 @@ class MultiSourceDataProvider:
         self.CIRCUIT_BREAKER_THRESHOLD = 3
         self.CIRCUIT_BREAKER_TIMEOUT   = 300
         self.MAX_RETRIES = 2
+        self.RACE_TIER1  = frozenset(TIER_1_BLUE_CHIPS)   # Yahoo ‖ Binance race
         self.BASE_DELAY  = 0.5
+        self.MAX_BACKOFF = 30
+
+        # Bulkhead — თითო source-ს საკუთარი connection pool + concurrency cap,
+        # რომ Yahoo-ს გაჭედვამ Binance/CoinGecko slot-ები არ დაიკავოს
+        self.SOURCE_CONCURRENCY = 8
+        # keep-alive socket-ები scan-ებს შორის (60s interval) ცოცხალი რჩება —
+        # ყოველ tick-ზე TCP+TLS handshake აღარ; DNS cache 5 წუთი
+        self.KEEPALIVE_TIMEOUT  = 75
+        self.DNS_CACHE_TTL      = 300
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._sems:     Dict[str, asyncio.Semaphore]     = {}
+        self._loop:     Optional[asyncio.AbstractEventLoop] = None
+        self._closing:  Set[asyncio.Task] = set()   # stale session-ების close task-ები
+
+        # p95-ზე ოდნავ მეტი — გაჭედილი Yahoo/Binance call 12s-ს აღარ კარგავს
+        fast = aiohttp.ClientTimeout(total=4.0, sock_connect=1.0, sock_read=2.0)
+        self._timeouts = {
+            "yahoo":     fast,
+            "binance":   fast,
+            "coingecko": aiohttp.ClientTimeout(total=10),
+        }
 
         self._init_symbol_mappings()
         logger.info("🟢 MultiSourceDataProvider v3.0 FIXED — preload enabled")
@@ -142,7 +195,7 @@ class MultiSourceDataProvider:
     # ─── Symbol Mappings (unchanged from v2.5) ────────────────────────────
 
     def _init_symbol_mappings(self):
-        self.yahoo_symbols = {
+        yahoo_symbols = {
             # ── 1. Core Majors ──────────────────────────────────────────────
             "BTC/USD":"BTC-USD","ETH/USD":"ETH-USD","BNB/USD":"BNB-USD",
             "SOL/USD":"SOL-USD","XRP/USD":"XRP-USD","ADA/USD":"ADA-USD",
@@ -208,7 +261,7 @@ class MultiSourceDataProvider:
             "CVX/USD":"CVX-USD","KAVA/USD":"KAVA-USD","OSMO/USD":"OSMO-USD",
             "STX/USD":"STX-USD","ORDI/USD":"ORDI-USD","SATS/USD":"SATS-USD",
         }
-        self.coingecko_ids = {
+        coingecko_ids = {
             # ── 1. Core Majors ──────────────────────────────────────────────
             "BTC/USD":"bitcoin","ETH/USD":"ethereum","BNB/USD":"binancecoin",
             "SOL/USD":"solana","XRP/USD":"ripple","ADA/USD":"cardano",
@@ -276,7 +329,7 @@ class MultiSourceDataProvider:
             "STX/USD":"blockstack","ORDI/USD":"ordinals",
             "SATS/USD":"1000sats-ordinals",
         }
-        self.binance_symbols = {
+        binance_symbols = {
             # ── 1. Core Majors ──────────────────────────────────────────────
             "BTC/USD":"BTCUSDT","ETH/USD":"ETHUSDT","BNB/USD":"BNBUSDT",
             "SOL/USD":"SOLUSDT","XRP/USD":"XRPUSDT","ADA/USD":"ADAUSDT",
@@ -343,14 +396,19 @@ class MultiSourceDataProvider:
             "STX/USD":"STXUSDT","ORDI/USD":"ORDIUSDT","SATS/USD":"1000SATSUSDT",
             # BRETT — Base chain token, Binance-ზე არ ვაჭრობს → Yahoo/CoinGecko only
         }
+        # symbol → (yahoo, coingecko, binance) — ერთი lookup ყველა fetcher-ისთვის
+        self.symbol_map: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]] = {
+            s: (yahoo_symbols.get(s), coingecko_ids.get(s), binance_symbols.get(s))
+            for s in yahoo_symbols.keys() | coingecko_ids.keys() | binance_symbols.keys()
+        }
 
     # ─── Circuit Breakers ─────────────────────────────────────────────────
 
-    def _is_circuit_open(self, source: str) -> bool:
+    def _is_circuit_open(self, source: str, now: float) -> bool:
         breaker = self.circuit_breakers[source]
         if breaker.status == SourceStatus.CIRCUIT_OPEN:
-            if time.time() - breaker.last_failure_time > self.CIRCUIT_BREAKER_TIMEOUT:
-                logger.info(f"🔄 Circuit reset: {source}")
+            if now - breaker.last_failure_time > self.CIRCUIT_BREAKER_TIMEOUT:
+                logger.info("🔄 Circuit reset: %s", source)
                 breaker.status = SourceStatus.HEALTHY
                 breaker.consecutive_failures = 0
                 return False
@@ -363,17 +421,70 @@ class MultiSourceDataProvider:
         self.stats[source]["success"] += 1
 
     def _record_failure(self, source: str, is_rate_limit: bool = False):
+        # clock აქ იკითხება — caller-ის now retry/backoff და batch sleep-ების შემდეგ ძველია
         b = self.circuit_breakers[source]
         b.failures += 1; b.consecutive_failures += 1
-        b.last_failure_time = time.time()
+        b.last_failure_time = time.monotonic()
         self.stats[source]["fail"] += 1
         if is_rate_limit: self.stats[source]["rate_limits"] += 1
         if b.consecutive_failures >= self.CIRCUIT_BREAKER_THRESHOLD:
             b.status = SourceStatus.CIRCUIT_OPEN
-            logger.warning(f"⚠️ CIRCUIT OPEN: {source}")
+            logger.warning("⚠️ CIRCUIT OPEN: %s", source)
+
+    def _ensure_ready(self):
+        """
+        asyncio primitives + sessions იქმნება მიმდინარე loop-ზე და არა singleton
+        __init__-ში — ახალი asyncio.run() loop-ზე ძველი Lock/session აღარ მუშაობს.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        old_loop, self._loop = self._loop, loop
+        stale = [s for s in self._sessions.values() if not s.closed]
+        self._preload_lock = asyncio.Lock()
+        self._sems = {src: asyncio.Semaphore(self.SOURCE_CONCURRENCY)
+                      for src in ("yahoo", "coingecko", "binance")}
+        self._sessions = {}   # ძველი loop-ის session-ები აქ გამოუსადეგარია
+        self._inflight = {}
+        # ძველი connector-ები იხურება — თავის loop-ზე, თუ ის ჯერ კიდევ მუშაობს
+        for sess in stale:
+            if old_loop is not None and old_loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._close_quietly(sess), old_loop)
+            else:
+                task = loop.create_task(self._close_quietly(sess))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_quietly(sess: aiohttp.ClientSession):
+        try:
+            await sess.close()
+        except Exception as e:   # დახურულ loop-ზე transport.close() ვარდება
+            logger.debug("stale session close failed: %s", e)
+
+    def _session(self, source: str) -> aiohttp.ClientSession:
+        sess = self._sessions.get(source)
+        if sess is None or sess.closed:
+            sess = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.SOURCE_CONCURRENCY,
+                    limit_per_host=self.SOURCE_CONCURRENCY,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=self.DNS_CACHE_TTL,
+                )
+            )
+            self._sessions[source] = sess
+        return sess
+
+    async def close(self):
+        for sess in self._sessions.values():
+            if not sess.closed:
+                await sess.close()
+        self._sessions.clear()
 
     async def _backoff(self, attempt: int):
-        await asyncio.sleep(min(self.BASE_DELAY * (2 ** attempt), 30))
+        # full jitter — parallel batch retries-ი ერთდროულად აღარ ურტყამს 429-ზე
+        await asyncio.sleep(random.uniform(0, min(self.BASE_DELAY * (2 ** attempt), self.MAX_BACKOFF)))
 
     # ─── P0/#1 — STARTUP PRELOAD ──────────────────────────────────────────
 
@@ -383,6 +494,7 @@ class MultiSourceDataProvider:
         Must complete before signals are generated.
         Returns: count of successfully preloaded symbols.
         """
+        self._ensure_ready()
         async with self._preload_lock:
             if self.preload_complete:
                 return len(self.preloaded_symbols)
@@ -400,7 +512,7 @@ class MultiSourceDataProvider:
                 if res is True:
                     ok += 1
                 elif isinstance(res, Exception):
-                    logger.warning(f"⚠️ Preload exc {sym}: {res}")
+                    logger.warning("⚠️ Preload exc %s: %s", sym, res)
 
             logger.info(f"📦 Batch {i//batch_size+1}: {ok}/{i+len(batch)}")
             if i + batch_size < len(symbols):
@@ -418,7 +530,7 @@ class MultiSourceDataProvider:
             if raw is None or len(raw.get("closes", [])) < 200:
                 return False
 
-            closes = list(raw["closes"])
+            closes = raw["closes"].tolist()
             vols   = raw.get("volumes", [])
 
             self._real_history[symbol] = closes[-200:]
@@ -427,20 +539,20 @@ class MultiSourceDataProvider:
                 self._real_volumes[symbol] = clean_v[-200:]
             else:
                 self._real_volumes[symbol] = []
-                logger.warning(f"⚠️ {symbol}: no volume in preload")
+                logger.warning("⚠️ %s: no volume in preload", symbol)
 
             # 4h data best-effort
             try:
                 raw4 = await self._fetch_raw_4h(symbol)
                 if raw4 and len(raw4.get("closes", [])) >= 30:
-                    self._history_4h[symbol] = list(raw4["closes"][-200:])
+                    self._history_4h[symbol] = raw4["closes"][-200:].tolist()
             except Exception:
                 pass
 
             self.preloaded_symbols.add(symbol)
             return True
         except Exception as e:
-            logger.error(f"❌ _preload_single {symbol}: {e}")
+            logger.error("❌ _preload_single %s: %s", symbol, e)
             return False
 
     def is_ready(self, symbol: str) -> bool:
@@ -456,180 +568,211 @@ class MultiSourceDataProvider:
 
     # ─── Raw Fetchers ──────────────────────────────────────────────────────
 
-    async def _fetch_raw_1h(self, symbol: str) -> Optional[Dict]:
-        raw = await self._fetch_yahoo(symbol, "1h", "1mo")
+    async def _fetch_raw_1h(self, symbol: str, now: Optional[float] = None) -> Optional[Dict]:
+        if now is None:
+            now = time.monotonic()
+        if symbol in self.RACE_TIER1:
+            raw = await self._fetch_raced(symbol, now)
+            return raw if raw is not None else await self._fetch_coingecko(symbol, now)
+        raw = await self._fetch_yahoo(symbol, "1h", "1mo", now)
         if raw is None:
-            raw = await self._fetch_coingecko(symbol)
+            raw = await self._fetch_coingecko(symbol, now)
         if raw is None:
-            raw = await self._fetch_binance(symbol, "1h", 200)
+            raw = await self._fetch_binance(symbol, "1h", 200, now)
         return raw
 
+    async def _fetch_raced(self, symbol: str, now: float) -> Optional[Dict]:
+        """
+        Tier-1: Yahoo და Binance პარალელურად — პირველი valid პასუხი იგებს,
+        დანარჩენი cancel. ორივე ერთდროულად თუ მოვიდა, Yahoo-ს უპირატესობა.
+        """
+        tasks = [
+            asyncio.create_task(self._fetch_yahoo(symbol, "1h", "1mo", now)),
+            asyncio.create_task(self._fetch_binance(symbol, "1h", 200, now)),
+        ]
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in tasks:
+                    if t in done and t.exception() is None and t.result() is not None:
+                        return t.result()
+            return None
+        finally:
+            for t in tasks:
+                if not t.done():
+                    t.cancel()
+
     async def _fetch_raw_4h(self, symbol: str) -> Optional[Dict]:
-        raw = await self._fetch_binance(symbol, "4h", 200)
+        now = time.monotonic()
+        raw = await self._fetch_binance(symbol, "4h", 200, now)
         if raw:
             return raw
-        raw1h = await self._fetch_yahoo(symbol, "1h", "3mo")
+        raw1h = await self._fetch_yahoo(symbol, "1h", "3mo", now)
         if raw1h and len(raw1h.get("closes", [])) >= 48:
-            c4 = list(raw1h["closes"])[::4]
+            c4 = raw1h["closes"][::4]
             v4 = raw1h.get("volumes", [])[::4]
-            return {"closes": pd.Series(c4), "volumes": v4}
+            return {"closes": c4, "volumes": v4}
         return None
 
-    async def _fetch_yahoo(self, symbol: str, interval: str = "1h", range_: str = "1mo") -> Optional[Dict]:
-        if self._is_circuit_open("yahoo"):
+    async def _fetch_yahoo(
+        self, symbol: str, interval: str = "1h", range_: str = "1mo", now: Optional[float] = None
+    ) -> Optional[Dict]:
+        self._ensure_ready()   # direct call-ზეც (race helper, tests) — _sems ამ loop-ზე
+        if now is None: now = time.monotonic()
+        if self._is_circuit_open("yahoo", now):
             return None
-        ys = self.yahoo_symbols.get(symbol)
+        ys, _, _ = self.symbol_map.get(symbol, _NO_MAPPING)
         if not ys:
             return None
         for attempt in range(self.MAX_RETRIES):
             try:
-                async with aiohttp.ClientSession() as sess:
+                async with self._sems["yahoo"]:
+                    sess = self._session("yahoo")
                     url = f"https://query1.finance.yahoo.com/v8/finance/chart/{ys}"
                     async with sess.get(
                         url, params={"interval": interval, "range": range_},
                         headers={"User-Agent": "Mozilla/5.0"},
-                        timeout=aiohttp.ClientTimeout(total=12)
+                        timeout=self._timeouts["yahoo"]
                     ) as r:
                         if r.status == 429:
                             self._record_failure("yahoo", True)
                             await self._backoff(attempt); continue
                         if r.status != 200:
                             self._record_failure("yahoo"); return None
-                        data = await r.json()
+                        data = _json_loads(await r.read())
                         result = data.get("chart", {}).get("result", [])
                         if not result: return None
                         q = result[0].get("indicators", {}).get("quote", [{}])[0]
                         paired = [(c, v) for c, v in zip(q.get("close", []), q.get("volume", []))
                                   if c is not None and np.isfinite(c) and c > 0]
                         if len(paired) < 50: return None
-                        closes  = [p[0] for p in paired]
+                        closes  = np.fromiter((p[0] for p in paired), dtype=np.float64, count=len(paired))
                         volumes = [float(p[1]) if p[1] is not None and np.isfinite(float(p[1])) else 0.0
                                    for p in paired]
                         self._record_success("yahoo")
-                        return {"closes": pd.Series(closes), "volumes": volumes}
+                        return {"closes": closes, "volumes": volumes}
             except asyncio.TimeoutError:
                 self._record_failure("yahoo")
                 if attempt < self.MAX_RETRIES - 1: await self._backoff(attempt)
             except Exception as e:
-                logger.debug(f"Yahoo err {symbol}: {e}")
+                logger.debug("Yahoo err %s: %s", symbol, e)
                 self._record_failure("yahoo"); break
         return None
 
-    async def _fetch_coingecko(self, symbol: str) -> Optional[Dict]:
-        if self._is_circuit_open("coingecko"): return None
-        cg = self.coingecko_ids.get(symbol)
+    async def _fetch_coingecko(self, symbol: str, now: Optional[float] = None) -> Optional[Dict]:
+        self._ensure_ready()
+        if now is None: now = time.monotonic()
+        if self._is_circuit_open("coingecko", now): return None
+        _, cg, _ = self.symbol_map.get(symbol, _NO_MAPPING)
         if not cg: return None
         for attempt in range(self.MAX_RETRIES):
             try:
-                async with aiohttp.ClientSession() as sess:
+                async with self._sems["coingecko"]:
+                    sess = self._session("coingecko")
                     url = f"https://api.coingecko.com/api/v3/coins/{cg}/market_chart"
                     async with sess.get(
                         url, params={"vs_currency": "usd", "days": "30", "interval": "hourly"},
                         headers={"User-Agent": "Mozilla/5.0", "Accept": "application/json"},
-                        timeout=aiohttp.ClientTimeout(total=12)
+                        timeout=self._timeouts["coingecko"]
                     ) as r:
                         if r.status == 429:
                             self._record_failure("coingecko", True); return None
                         if r.status != 200:
                             self._record_failure("coingecko"); return None
-                        data = await r.json()
+                        data = _json_loads(await r.read())
                         prices = data.get("prices", [])
                         tvols  = data.get("total_volumes", [])
                         if len(prices) < 50: return None
-                        closes  = [float(p[1]) for p in prices[-200:]]
+                        tail    = prices[-200:]
+                        closes  = np.fromiter((float(p[1]) for p in tail), dtype=np.float64, count=len(tail))
                         volumes = ([float(v[1]) for v in tvols[-200:]] if len(tvols) >= 200
                                    else [float(tvols[-1][1])]*len(closes) if tvols else [])
                         self._record_success("coingecko")
-                        return {"closes": pd.Series(closes), "volumes": volumes}
+                        return {"closes": closes, "volumes": volumes}
             except asyncio.TimeoutError:
                 self._record_failure("coingecko"); return None
             except Exception as e:
-                logger.debug(f"CG err {symbol}: {e}")
+                logger.debug("CG err %s: %s", symbol, e)
                 self._record_failure("coingecko"); break
         return None
 
-    async def _fetch_binance(self, symbol: str, interval: str = "1h", limit: int = 200) -> Optional[Dict]:
-        if self._is_circuit_open("binance"): return None
-        bs = self.binance_symbols.get(symbol)
+    async def _fetch_binance(
+        self, symbol: str, interval: str = "1h", limit: int = 200, now: Optional[float] = None
+    ) -> Optional[Dict]:
+        self._ensure_ready()
+        if now is None: now = time.monotonic()
+        if self._is_circuit_open("binance", now): return None
+        _, _, bs = self.symbol_map.get(symbol, _NO_MAPPING)
         if not bs: return None
         for attempt in range(self.MAX_RETRIES):
             try:
-                async with aiohttp.ClientSession() as sess:
+                async with self._sems["binance"]:
+                    sess = self._session("binance")
                     async with sess.get(
                         "https://api.binance.com/api/v3/klines",
                         params={"symbol": bs, "interval": interval, "limit": limit},
-                        timeout=aiohttp.ClientTimeout(total=12)
+                        timeout=self._timeouts["binance"]
                     ) as r:
                         if r.status == 429:
                             self._record_failure("binance", True); return None
                         if r.status != 200:
                             self._record_failure("binance"); return None
-                        data = await r.json()
+                        data = _json_loads(await r.read())
                         if len(data) < 50: return None
-                        closes  = [float(c[4]) for c in data]
+                        closes  = np.fromiter((float(c[4]) for c in data), dtype=np.float64, count=len(data))
                         volumes = [float(c[5]) for c in data]
                         self._record_success("binance")
-                        return {"closes": pd.Series(closes), "volumes": volumes}
+                        return {"closes": closes, "volumes": volumes}
             except asyncio.TimeoutError:
                 self._record_failure("binance"); return None
             except Exception as e:
-                logger.debug(f"Binance err {symbol}: {e}")
+                logger.debug("Binance err %s: %s", symbol, e)
                 self._record_failure("binance"); break
         return None
 
     # ─── Indicator Calculation ─────────────────────────────────────────────
 
     def _calculate_indicators(
-        self, close_series: pd.Series, symbol: str, volumes: Optional[list] = None
+        self, closes: np.ndarray, symbol: str, volumes: Optional[list] = None
     ) -> Optional[Dict]:
         try:
-            price = float(close_series.iloc[-1])
+            price = float(closes[-1])
             if price <= 0 or not np.isfinite(price): return None
-            prev_close = float(close_series.iloc[-2]) if len(close_series) > 1 else price
+            prev_close = float(closes[-2]) if len(closes) > 1 else price
 
-            rsi_s  = RSIIndicator(close_series, window=14).rsi()
-            rsi_v  = float(rsi_s.iloc[-1]) if not pd.isna(rsi_s.iloc[-1]) else 50.0
-            prev_r = float(rsi_s.iloc[-2]) if len(rsi_s) > 1 and not pd.isna(rsi_s.iloc[-2]) else rsi_v
+            close_series = pd.Series(closes)   # ta indicators require a Series
+
+            rsi_s  = RSIIndicator(close_series, window=14).rsi().to_numpy()
+            rsi_v  = _f(rsi_s[-1], 50.0)
+            prev_r = _f(rsi_s[-2], rsi_v) if len(rsi_s) > 1 else rsi_v
 
             e50 = price
             if len(close_series) >= 50:
-                s50 = EMAIndicator(close_series, window=50).ema_indicator()
-                if not pd.isna(s50.iloc[-1]): e50 = float(s50.iloc[-1])
-            s200 = EMAIndicator(close_series, window=200).ema_indicator()
-            e200 = float(s200.iloc[-1]) if not pd.isna(s200.iloc[-1]) else price
+                e50 = _f(EMAIndicator(close_series, window=50).ema_indicator().iloc[-1], price)
+            e200 = _f(EMAIndicator(close_series, window=200).ema_indicator().iloc[-1], price)
 
             try:
                 mi  = MACD(close_series)
-                ml  = float(mi.macd().iloc[-1]        or 0.0); ml  = 0.0 if pd.isna(ml)  else ml
-                ms  = float(mi.macd_signal().iloc[-1] or 0.0); ms  = 0.0 if pd.isna(ms)  else ms
-                mh  = float(mi.macd_diff().iloc[-1]   or 0.0); mh  = 0.0 if pd.isna(mh)  else mh
-                mhp = float(mi.macd_diff().iloc[-2]   or 0.0) if len(close_series) > 26 else mh
-                mhp = 0.0 if pd.isna(mhp) else mhp
+                md  = mi.macd_diff().to_numpy()
+                ml  = _f(mi.macd().iloc[-1],        0.0)
+                ms  = _f(mi.macd_signal().iloc[-1], 0.0)
+                mh  = _f(md[-1], 0.0)
+                mhp = _f(md[-2], 0.0) if len(close_series) > 26 else mh
             except Exception:
                 ml = ms = mh = mhp = 0.0
 
-            bb = BollingerBands(close_series)
-            def _s(v, fb): return fb if pd.isna(v) else float(v)
-            bbl  = _s(bb.bollinger_lband().iloc[-1],  price * 0.9)
-            bbh  = _s(bb.bollinger_hband().iloc[-1],  price * 1.1)
-            bbm  = _s(bb.bollinger_mavg().iloc[-1],   price)
+            bb   = BollingerBands(close_series)
+            hb   = bb.bollinger_hband()
+            lb   = bb.bollinger_lband()
+            bbl  = _f(lb.iloc[-1], price * 0.9)
+            bbh  = _f(hb.iloc[-1], price * 1.1)
+            bbm  = _f(bb.bollinger_mavg().iloc[-1], price)
             bbw  = bbh - bbl
-            bws  = (bb.bollinger_hband() - bb.bollinger_lband())[-20:].dropna()
+            bws  = (hb - lb)[-20:].dropna()
             avgw = float(bws.mean()) if len(bws) > 0 else bbw
 
-            # P0/#2 — real volume only
-            vol_missing = True
-            cur_v = avg_v = 0.0
-            if volumes and len(volumes) >= 20:
-                cv = [v for v in volumes if v is not None and np.isfinite(v) and v >= 0]
-                if len(cv) >= 20:
-                    cur_v = float(cv[-1])
-                    avg_v = float(np.mean(cv[-20:]))
-                    if cur_v == 0 and len(cv) >= 2: cur_v = float(cv[-2])
-                    vol_missing = False
-
-            if vol_missing:
-                logger.debug(f"{symbol}: volume missing → volume-dependent signals will be blocked")
+            cur_v, avg_v, vol_missing = self._volume_stats(symbol, volumes)
 
             return {
                 "price": price, "prev_close": prev_close,
@@ -642,9 +785,125 @@ class MultiSourceDataProvider:
                 "bb_width": bbw, "avg_bb_width_20d": avgw,
             }
         except Exception as e:
-            logger.error(f"❌ Indicators failed ({symbol}): {e}")
+            logger.error("❌ Indicators failed (%s): %s", symbol, e)
             return None
 
+    def _volume_stats(self, symbol: str, volumes: Optional[list]) -> Tuple[float, float, bool]:
+        """P0/#2 — real volume only → (current, avg20, volume_missing)"""
+        vol_missing = True
+        cur_v = avg_v = 0.0
+        if volumes and len(volumes) >= 20:
+            cv = [v for v in volumes if v is not None and np.isfinite(v) and v >= 0]
+            if len(cv) >= 20:
+                cur_v = float(cv[-1])
+                avg_v = float(np.mean(cv[-20:]))
+                if cur_v == 0 and len(cv) >= 2: cur_v = float(cv[-2])
+                vol_missing = False
+
+        if vol_missing:
+            logger.debug("%s: volume missing → volume-dependent signals will be blocked", symbol)
+        return cur_v, avg_v, vol_missing
+
+    def _calculate_indicators_batch(
+        self, closes: Dict[str, np.ndarray], volumes: Dict[str, list]
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        _calculate_indicators-ის ექვივალენტი N symbol-ზე ერთი DataFrame pass-ით.
+        Series-ები ბოლოდან სწორდება (index = -len..-1), მოკლე სვეტებს თავში NaN
+        აქვს — ewm/rolling NaN-ს min_periods-ში არ ითვლის, ამიტომ შედეგი იგივეა.
+        """
+        out: Dict[str, Optional[Dict]] = {}
+        valid = {}
+        for sym, c in closes.items():
+            if len(c) and c[-1] > 0 and np.isfinite(c[-1]):
+                valid[sym] = c
+            else:
+                out[sym] = None
+        if not valid:
+            return out
+
+        df = pd.DataFrame({sym: pd.Series(c, index=range(-len(c), 0)) for sym, c in valid.items()})
+        present = df.notna()
+
+        # RSI(14) — ta-ს მსგავსად პირველი diff → 0.0, padding → NaN
+        diff = df.diff(1)
+        up   = diff.where(diff > 0, 0.0).where(present)
+        dn   = (-diff).where(diff < 0, 0.0).where(present)
+        emau = up.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+        emad = dn.ewm(alpha=1 / 14, min_periods=14, adjust=False).mean()
+        rsi  = (100 - 100 / (1 + emau / emad)).mask(emad == 0, 100.0).to_numpy()
+
+        e50  = df.ewm(span=50,  min_periods=50,  adjust=False).mean().to_numpy()
+        e200 = df.ewm(span=200, min_periods=200, adjust=False).mean().to_numpy()
+
+        macd = (df.ewm(span=12, min_periods=12, adjust=False).mean()
+                - df.ewm(span=26, min_periods=26, adjust=False).mean())
+        sig  = macd.ewm(span=9, min_periods=9, adjust=False).mean()
+        hist = (macd - sig).to_numpy()
+        macd = macd.to_numpy()
+        sig  = sig.to_numpy()
+
+        mavg = df.rolling(20, min_periods=20).mean()
+        mstd = df.rolling(20, min_periods=20).std(ddof=0)
+        hb   = mavg + 2 * mstd
+        lb   = mavg - 2 * mstd
+        avgw = (hb - lb).iloc[-20:].mean()
+        hb, lb, mavg = hb.to_numpy(), lb.to_numpy(), mavg.to_numpy()
+
+        for j, sym in enumerate(df.columns):
+            n     = len(valid[sym])
+            price = float(valid[sym][-1])
+            prev_close = float(valid[sym][-2]) if n > 1 else price
+
+            rsi_v  = _f(rsi[-1, j], 50.0)
+            prev_r = _f(rsi[-2, j], rsi_v) if n > 1 else rsi_v
+            mh     = _f(hist[-1, j], 0.0)
+            bbl    = _f(lb[-1, j], price * 0.9)
+            bbh    = _f(hb[-1, j], price * 1.1)
+            bbw    = bbh - bbl
+            cur_v, avg_v, vol_missing = self._volume_stats(sym, volumes.get(sym))
+
+            out[sym] = {
+                "price": price, "prev_close": prev_close,
+                "volume": cur_v, "avg_volume_20d": avg_v, "volume_missing": vol_missing,
+                "rsi": rsi_v, "prev_rsi": prev_r,
+                "ema50": _f(e50[-1, j], price) if n >= 50 else price,
+                "ema200": _f(e200[-1, j], price),
+                "macd": _f(macd[-1, j], 0.0), "macd_signal": _f(sig[-1, j], 0.0),
+                "macd_histogram": mh,
+                "macd_histogram_prev": _f(hist[-2, j], 0.0) if n > 26 else mh,
+                "bb_low": bbl, "bb_high": bbh, "bb_mid": _f(mavg[-1, j], price),
+                "bb_width": bbw, "avg_bb_width_20d": _f(avgw.iloc[j], bbw),
+            }
+        return out
+
+    def _ind_key(self, symbol: str, closes: np.ndarray, volumes: Optional[list]) -> Tuple:
+        return (symbol, len(closes), hash(closes.tobytes()),
+                tuple(volumes[-20:]) if volumes else ())
+
+    def _ind_cache_put(self, key: Tuple, ind: Optional[Dict]):
+        if ind:
+            if len(self._ind_cache) >= self._ind_cache_max:
+                self._ind_cache.pop(next(iter(self._ind_cache)))
+            self._ind_cache[key] = ind
+
+    def _cached_indicators(
+        self, closes: np.ndarray, symbol: str, volumes: Optional[list] = None
+    ) -> Optional[Dict]:
+        """
+        Bar fingerprint → indicators. Yahoo-ს ბოლო 1h bar საათის განმავლობაში
+        იცვლება, ამიტომ key = series-ის შიგთავსი და არა საათის grid.
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        key = self._ind_key(symbol, closes, volumes)
+        ind = self._ind_cache.get(key)
+        if ind is not None:
+            return ind
+
+        ind = self._calculate_indicators(closes, symbol, volumes)
+        self._ind_cache_put(key, ind)
+        return ind
+
     # ─── P1/#4 — Real Multi-TF ────────────────────────────────────────────
 
     def _calculate_multi_tf(self, symbol: str, price: float) -> MultiTFData:
@@ -685,7 +944,7 @@ class MultiSourceDataProvider:
                     if price > dv * 1.005:   mtf.trend_1d = "bullish"
                     elif price < dv * 0.995: mtf.trend_1d = "bearish"
             except Exception as e:
-                logger.debug(f"MTF 1h {symbol}: {e}")
+                logger.debug("MTF 1h %s: %s", symbol, e)
 
         # 4H
         h4 = self._history_4h.get(symbol, [])
@@ -703,7 +962,7 @@ class MultiSourceDataProvider:
                 if mtf.ema50_4h > mtf.ema200_4h and price > mtf.ema50_4h*0.98:    mtf.trend_4h = "bullish"
                 elif mtf.ema50_4h < mtf.ema200_4h and price < mtf.ema50_4h*1.02: mtf.trend_4h = "bearish"
             except Exception as e:
-                logger.debug(f"MTF 4h {symbol}: {e}")
+                logger.debug("MTF 4h %s: %s", symbol, e)
 
         # Alignment
         tm = {"bullish": 100.0, "neutral": 50.0, "bearish": 0.0}
@@ -713,16 +972,105 @@ class MultiSourceDataProvider:
     # ─── Main Fetch ───────────────────────────────────────────────────────
 
     async def fetch_with_fallback(self, symbol: str) -> Optional[MarketData]:
+        self._ensure_ready()
+        now = time.monotonic()   # ერთი clock read — cache, breakers, fetchers
         if symbol in self.cache:
             md, ts = self.cache[symbol]
-            if time.time() - ts < self.cache_ttl:
+            if now - ts < self.cache_ttl:
                 return md
 
-        raw = await self._fetch_raw_1h(symbol)
+        # Request coalescing — ერთი symbol-ის პარალელური call-ები ერთ fetch-ს ელოდება
+        task = self._inflight.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_build(symbol, now))
+            self._inflight[symbol] = task
+            task.add_done_callback(lambda _t, s=symbol: self._inflight.pop(s, None))
+        # shield — ერთი caller-ის cancel საერთო fetch-ს არ კლავს
+        return await asyncio.shield(task)
+
+    async def _fetch_and_build(self, symbol: str, now: float) -> Optional[MarketData]:
+        raw = await self._fetch_raw_1h(symbol, now)
         if raw is None:
-            logger.error(f"❌ All sources failed: {symbol}")
+            logger.error("❌ All sources failed: %s", symbol)
+            return None
+
+        ingested = self._ingest_raw(symbol, raw)
+        if ingested is None:
+            return None
+        cs, use_vols = ingested
+
+        ind = self._cached_indicators(cs, symbol, use_vols)
+        if not ind:
             return None
+        # cache TTL ითვლება build-იდან — fetch-მდე წაკითხული now აქ ძველია
+        return self._build_market_data(symbol, ind, time.monotonic())
+
+    async def fetch_many(self, symbols: List[str], batch_size: int = 8) -> Dict[str, MarketData]:
+        """
+        Scan-ის წინ ყველა symbol: network batch-ებად (preload-ის მსგავსად),
+        indicators კი ყველა cache-miss-ზე ერთი vectorized pass-ით.
+        შედეგი self.cache-შიც ჩაიწერება → შემდეგი fetch_with_fallback = cache hit.
+        """
+        self._ensure_ready()
+        now = time.monotonic()
+        out: Dict[str, MarketData] = {}
+        todo: List[str] = []
+        for sym in symbols:
+            hit = self.cache.get(sym)
+            if hit and now - hit[1] < self.cache_ttl:
+                out[sym] = hit[0]
+            else:
+                todo.append(sym)
+
+        ingested: Dict[str, Tuple[np.ndarray, list]] = {}
+        for i in range(0, len(todo), batch_size):
+            batch = todo[i:i + batch_size]
+            now = time.monotonic()   # batch-ზე ერთხელ — წინა batch-ის sleep-ის შემდეგ
+            raws = await asyncio.gather(
+                *[self._fetch_raw_1h(s, now) for s in batch], return_exceptions=True
+            )
+            for sym, raw in zip(batch, raws):
+                if isinstance(raw, Exception):
+                    logger.warning("⚠️ fetch_many exc %s: %s", sym, raw)
+                elif raw is None:
+                    logger.error("❌ All sources failed: %s", sym)
+                else:
+                    res = self._ingest_raw(sym, raw)
+                    if res is not None:
+                        ingested[sym] = res
+            if i + batch_size < len(todo):
+                await asyncio.sleep(2.5)
 
+        inds: Dict[str, Dict] = {}
+        keys: Dict[str, Tuple] = {}
+        for sym, (cs, vols) in ingested.items():
+            keys[sym] = self._ind_key(sym, cs, vols)
+            hit = self._ind_cache.get(keys[sym])
+            if hit is not None:
+                inds[sym] = hit
+        misses = [s for s in ingested if s not in inds]
+        if misses:
+            try:
+                fresh = self._calculate_indicators_batch(
+                    {s: ingested[s][0] for s in misses},
+                    {s: ingested[s][1] for s in misses},
+                )
+            except Exception as e:
+                logger.error("❌ Batch indicators failed: %s", e)
+                fresh = {s: self._calculate_indicators(ingested[s][0], s, ingested[s][1])
+                         for s in misses}
+            for sym, ind in fresh.items():
+                self._ind_cache_put(keys[sym], ind)
+                if ind:
+                    inds[sym] = ind
+
+        built = time.monotonic()   # cache TTL ითვლება build-იდან, არა batch-ის დაწყებიდან
+        for sym, ind in inds.items():
+            out[sym] = self._build_market_data(sym, ind, built)
+        return out
+
+    def _ingest_raw(self, symbol: str, raw: Dict) -> Optional[Tuple[np.ndarray, list]]:
+        """raw → real history update → (closes, volumes for indicators)"""
         cs   = raw.get("closes")
         vols = raw.get("volumes", [])
         if cs is None or len(cs) < 50:
@@ -730,41 +1078,33 @@ class MultiSourceDataProvider:
 
         # Update real history incrementally
         existing = self._real_history.get(symbol, [])
-        merged   = existing + [c for c in list(cs) if not existing or c != existing[-1]]
+        merged   = existing + [c for c in cs.tolist() if not existing or c != existing[-1]]
         self._real_history[symbol] = merged[-300:]
         if vols:
             cv = [v for v in vols if v is not None and np.isfinite(v) and v >= 0]
             if cv: self._real_volumes[symbol] = cv[-200:]
 
         use_vols = vols if vols else self._real_volumes.get(symbol, [])
-        ind = self._calculate_indicators(cs, symbol, use_vols)
-        if not ind:
-            return None
+        return np.asarray(cs, dtype=np.float64), use_vols
 
+    def _build_market_data(self, symbol: str, ind: Dict, now: float) -> MarketData:
         mtf = self._calculate_multi_tf(symbol, ind["price"])
 
+        # ind-ის key-ები ზუსტად MarketData-ს field-ებია
         md = MarketData(
-            symbol=symbol, price=ind["price"], prev_close=ind["prev_close"],
-            rsi=ind["rsi"], prev_rsi=ind["prev_rsi"],
-            ema50=ind["ema50"], ema200=ind["ema200"],
-            macd=ind["macd"], macd_signal=ind["macd_signal"],
-            macd_histogram=ind["macd_histogram"],
-            macd_histogram_prev=ind.get("macd_histogram_prev", ind["macd_histogram"]),
-            volume=ind["volume"], avg_volume_20d=ind["avg_volume_20d"],
-            bb_low=ind["bb_low"], bb_high=ind["bb_high"], bb_mid=ind["bb_mid"],
-            bb_width=ind["bb_width"], avg_bb_width_20d=ind["avg_bb_width_20d"],
-            source="multi", timestamp=time.time(),
-            multi_tf=mtf,
-            volume_missing=ind.get("volume_missing", False),
+            symbol=symbol, source="multi", timestamp=time.time(),
+            multi_tf=mtf, **ind,
         )
 
-        self.cache[symbol] = (md, time.time())
-        vr = (ind["volume"] / max(ind["avg_volume_20d"], 1)) if not ind.get("volume_missing") else 0.0
-        logger.info(
-            f"✅ {symbol}: ${ind['price']:.6f} | RSI:{ind['rsi']:.1f} | "
-            f"1H:{mtf.trend_1h} 4H:{mtf.trend_4h} 1D:{mtf.trend_1d} | "
-            f"Vol:{'N/A' if ind.get('volume_missing') else f'{vr:.2f}x'}"
-        )
+        self.cache[symbol] = (md, now)
+        if logger.isEnabledFor(logging.INFO):
+            vr = (ind["volume"] / max(ind["avg_volume_20d"], 1)) if not ind.get("volume_missing") else 0.0
+            logger.info(
+                "✅ %s: $%.6f | RSI:%.1f | 1H:%s 4H:%s 1D:%s | Vol:%s",
+                symbol, ind["price"], ind["rsi"],
+                mtf.trend_1h, mtf.trend_4h, mtf.trend_1d,
+                "N/A" if ind.get("volume_missing") else f"{vr:.2f}x",
+            )
         return md
 
     def get_real_history(self, symbol: str, length: int = 200) -> np.ndarray:
@@ -12,13 +12,20 @@ RESULT: Much more conservative, realistic confidence scores
 """
 
 import logging
+import sys
 import numpy as np
 from enum import Enum
 from dataclasses import dataclass
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Sequence, Tuple
+
+from _njit import NUMBA_AVAILABLE
+from _regime_kernels import (
+    _trend_strength_nb, _vol_pct_nb, _structural_nb, _classify_nb, _analyze_many_nb,
+)
 
 logger = logging.getLogger(__name__)
 
+
 class MarketRegime(Enum):
     """ბაზრის რეჟიმები"""
     BULL_STRONG = "bull_strong"
@@ -31,7 +38,44 @@ class MarketRegime(Enum):
     BREAKOUT_PENDING = "breakout_pending"
     SPONTANEOUS_EVENT = "spontaneous_event"
 
-@dataclass
+    @property
+    def code(self) -> int:
+        """რიგითი int8 კოდი (numba kernel-ები / numpy history) — .value string რჩება"""
+        return _CODE_BY_REGIME[self]
+
+_REGIME_BY_CODE = tuple(MarketRegime)   # _classify_nb code → MarketRegime
+_HISTORY_LEN = 10                        # ბოლო რამდენი რეჟიმი ინახება symbol-ზე
+_CODE_BY_REGIME = {r: i for i, r in enumerate(_REGIME_BY_CODE)}
+
+_LONG_TERM_REGIMES = frozenset((
+    MarketRegime.BULL_STRONG, MarketRegime.BULL_WEAK, MarketRegime.CONSOLIDATION
+))
+_SCALPING_REGIMES = frozenset((MarketRegime.HIGH_VOLATILITY, MarketRegime.BREAKOUT_PENDING))
+
+# reasoning/warning ტექსტები — ერთხელ, module-ზე; რიცხვიანი შაბლონების .format წინასწარ bound
+_FMT_TREND_STRONG_UP   = "ძლიერი აღმავალი ტრენდი ({:.2f})".format
+_FMT_TREND_UP          = "საშუალო აღმავალი ტრენდი ({:.2f})".format
+_FMT_TREND_STRONG_DOWN = "ძლიერი დაღმავალი ტრენდი ({:.2f})".format
+_FMT_TREND_DOWN        = "საშუალო დაღმავალი ტრენდი ({:.2f})".format
+_MSG_FLAT         = sys.intern("ფლეტი/რენჯი")
+_MSG_VOL_EXTREME  = sys.intern("🔥 ექსტრემალური ვოლატილობა")
+_MSG_VOL_HIGH     = sys.intern("⚡ მაღალი ვოლატილობა")
+_MSG_VOL_LOW      = sys.intern("💤 დაბალი ვოლატილობა")
+_MSG_STRUCTURAL   = sys.intern("✅ სტრუქტურული მოძრაობა")
+_MSG_NOISE        = sys.intern("⚠️ შესაძლოა ხმაურია")
+_WARN_VOL_EXTREME = sys.intern("მაღალი რისკი - სწრაფი მოძრაობები")
+_WARN_VOL_HIGH    = sys.intern("გაზრდილი რისკი")
+_WARN_NOISE       = sys.intern("არასტაბილური სიგნალი")
+
+# BB პოზიციის 4 მდგომარეობა — shared, read-only dict-ები (ყოველ call-ზე ახალი არ იქმნება)
+_BB_STATES = (
+    {'description': '📉 BB ქვედა ზოლთან (oversold)', 'warning': None},
+    {'description': '⚖️ BB შუაში (ნეიტრალური)', 'warning': None},
+    {'description': '📊 BB ზოლებში', 'warning': None},
+    {'description': '📈 BB ზედა ზოლთან (overbought)', 'warning': 'გადახურების რისკი - ძალიან მაღალია'},
+)
+
+@dataclass(slots=True)
 class RegimeAnalysis:
     """ბაზრის რეჟიმის ანალიზის შედეგი"""
     regime: MarketRegime
@@ -43,17 +87,45 @@ class RegimeAnalysis:
     warning_flags: List[str]
 
     def is_favorable_for_long_term(self) -> bool:
-        return self.regime in [
-            MarketRegime.BULL_STRONG,
-            MarketRegime.BULL_WEAK,
-            MarketRegime.CONSOLIDATION
-        ] and self.is_structural
+        return self.regime in _LONG_TERM_REGIMES and self.is_structural
 
     def is_favorable_for_scalping(self) -> bool:
-        return self.regime in [
-            MarketRegime.HIGH_VOLATILITY,
-            MarketRegime.BREAKOUT_PENDING
-        ] and self.volatility_percentile > 60
+        return self.regime in _SCALPING_REGIMES and self.volatility_percentile > 60
+
+@dataclass(slots=True)
+class RegimeBatch:
+    """analyze_many-ის შედეგი: arrays, RegimeAnalysis იქმნება მხოლოდ analysis(i)-ზე"""
+    symbols: List[str]
+    codes: np.ndarray
+    confidence: np.ndarray
+    trend_strength: np.ndarray
+    volatility_percentile: np.ndarray
+    is_structural: np.ndarray
+    prices: np.ndarray
+    bb_lows: np.ndarray
+    bb_highs: np.ndarray
+    detector: "MarketRegimeDetector"
+
+    def regime(self, i: int) -> MarketRegime:
+        return _REGIME_BY_CODE[self.codes[i]]
+
+    def analysis(self, i: int) -> RegimeAnalysis:
+        trend = float(self.trend_strength[i])
+        vol = float(self.volatility_percentile[i])
+        structural = bool(self.is_structural[i])
+        bb_position = self.detector._analyze_bollinger_position(
+            float(self.prices[i]), float(self.bb_lows[i]), float(self.bb_highs[i])
+        )
+        reasoning, warnings = self.detector._describe(trend, vol, structural, bb_position)
+        return RegimeAnalysis(
+            regime=self.regime(i),
+            confidence=float(self.confidence[i]),
+            trend_strength=trend,
+            volatility_percentile=vol,
+            is_structural=structural,
+            reasoning=reasoning,
+            warning_flags=warnings
+        )
 
 class MarketRegimeDetector:
     """
@@ -63,7 +135,18 @@ class MarketRegimeDetector:
     """
 
     def __init__(self):
-        self.regime_history = {}
+        # symbol → (int8 ring buffer, [head]) — head = სულ ჩაწერილი რეჟიმების რაოდენობა
+        self.regime_history: Dict[str, Tuple[np.ndarray, List[int]]] = {}
+
+    def _push_history(self, symbol: str, code: int) -> None:
+        entry = self.regime_history.get(symbol)
+        if entry is None:
+            entry = self.regime_history[symbol] = (
+                np.full(_HISTORY_LEN, -1, dtype=np.int8), [0]
+            )
+        buf, head = entry
+        buf[head[0] % _HISTORY_LEN] = code
+        head[0] += 1
 
     def analyze_regime(
         self, 
@@ -74,53 +157,40 @@ class MarketRegimeDetector:
         ema200: float,
         bb_low: float,
         bb_high: float,
-        volume_history: Optional[np.ndarray] = None
+        volume_history: Optional[np.ndarray] = None,
+        verbose: bool = True
     ) -> RegimeAnalysis:
-        """ძირითადი ფუნქცია - ბაზრის რეჟიმის გამოცნობა"""
-
-        reasoning = []
-        warnings = []
-
-        # 1. TREND ANALYSIS
-        trend_strength = self._calculate_trend_strength(price, ema200, price_history)
-
-        if trend_strength > 0.7:
-            reasoning.append(f"ძლიერი აღმავალი ტრენდი ({trend_strength:.2f})")
-        elif trend_strength > 0.3:
-            reasoning.append(f"საშუალო აღმავალი ტრენდი ({trend_strength:.2f})")
-        elif trend_strength < -0.7:
-            reasoning.append(f"ძლიერი დაღმავალი ტრენდი ({trend_strength:.2f})")
-        elif trend_strength < -0.3:
-            reasoning.append(f"საშუალო დაღმავალი ტრენდი ({trend_strength:.2f})")
-        else:
-            reasoning.append("ფლეტი/რენჯი")
+        """
+        ძირითადი ფუნქცია - ბაზრის რეჟიმის გამოცნობა.
+        verbose=False → reasoning/warning_flags ცარიელია (მხოლოდ warning-ების რაოდენობა
+        ითვლება confidence-ისთვის) — სკანერებისთვის, რომლებიც ტექსტს არ კითხულობენ.
+        """
 
-        # 2. VOLATILITY ASSESSMENT
-        volatility_percentile = self._calculate_volatility_percentile(price_history)
+        # unit-stride float64 — strided view (მაგ. pandas column slice) აქ ერთხელ
+        # კოპირდება და არა თითოეულ numpy op-ში; contiguous float64 array უცვლელად გადის
+        price_history = np.ascontiguousarray(price_history, dtype=np.float64)
 
-        if volatility_percentile > 90:
-            reasoning.append("🔥 ექსტრემალური ვოლატილობა")
-            warnings.append("მაღალი რისკი - სწრაფი მოძრაობები")
-        elif volatility_percentile > 70:
-            reasoning.append("⚡ მაღალი ვოლატილობა")
-            warnings.append("გაზრდილი რისკი")
-        elif volatility_percentile < 30:
-            reasoning.append("💤 დაბალი ვოლატილობა")
-
-        # 3. STRUCTURAL vs NOISE
-        is_structural = self._is_structural_move(price_history, trend_strength)
+        # returns ერთხელ — სამივე helper ამას იყენებს
+        returns = np.diff(price_history) / price_history[:-1]
 
-        if is_structural:
-            reasoning.append("✅ სტრუქტურული მოძრაობა")
-        else:
-            reasoning.append("⚠️ შესაძლოა ხმაურია")
-            warnings.append("არასტაბილური სიგნალი")
+        # 1-3. TREND / VOLATILITY / STRUCTURAL
+        trend_strength = self._calculate_trend_strength(price, ema200, returns)
+        volatility_percentile = self._calculate_volatility_percentile(returns)
+        is_structural = self._is_structural_move(returns, trend_strength)
 
         # 4. BOLLINGER BAND POSITION
         bb_position = self._analyze_bollinger_position(price, bb_low, bb_high)
-        reasoning.append(bb_position['description'])
-        if bb_position['warning']:
-            warnings.append(bb_position['warning'])
+        if verbose:
+            reasoning, warnings = self._describe(
+                trend_strength, volatility_percentile, is_structural, bb_position
+            )
+            warning_count = len(warnings)
+        else:
+            reasoning, warnings = [], []
+            warning_count = (
+                (volatility_percentile > 70) + (not is_structural)
+                + (bb_position['warning'] is not None)
+            )
 
         # 5. REGIME CLASSIFICATION
         regime = self._classify_regime(
@@ -130,16 +200,11 @@ class MarketRegimeDetector:
 
         # 6. ✅ REALISTIC CONFIDENCE
         confidence = self._calculate_confidence(
-            is_structural, volatility_percentile, len(warnings)
+            is_structural, volatility_percentile, warning_count
         )
 
-        # 7. STORE HISTORY
-        if symbol not in self.regime_history:
-            self.regime_history[symbol] = []
-
-        self.regime_history[symbol].append(regime)
-        if len(self.regime_history[symbol]) > 10:
-            self.regime_history[symbol].pop(0)
+        # 7. STORE HISTORY — ring buffer, უძველესი თავისით გადაიწერება
+        self._push_history(symbol, regime.code)
 
         return RegimeAnalysis(
             regime=regime,
@@ -151,40 +216,161 @@ class MarketRegimeDetector:
             warning_flags=warnings
         )
 
-    def _calculate_trend_strength(self, price: float, ema200: float, price_history: np.ndarray) -> float:
+    def analyze_many(
+        self,
+        symbols: Sequence[str],
+        prices: Sequence[float],
+        price_histories,
+        rsis: Sequence[float],
+        ema200s: Sequence[float],
+        bb_lows: Sequence[float],
+        bb_highs: Sequence[float],
+        window: int = 200,
+        history_dtype=np.float64,
+    ) -> RegimeBatch:
+        """
+        analyze_regime N symbol-ზე ერთი call-ით. price_histories — (N, W) array ან
+        1D array-ების list; ყოველი row-დან გამოიყენება ბოლო `window` წერტილი.
+        history_dtype=np.float32 → ისტორია ნახევარი ზომისაა (trend/vol მიახლოებით
+        იგივეა, accumulation მაინც float64-შია).
+        """
+        N = len(symbols)
+        prices   = np.ascontiguousarray(prices,   dtype=np.float64)
+        rsis     = np.ascontiguousarray(rsis,     dtype=np.float64)
+        ema200s  = np.ascontiguousarray(ema200s,  dtype=np.float64)
+        bb_lows  = np.ascontiguousarray(bb_lows,  dtype=np.float64)
+        bb_highs = np.ascontiguousarray(bb_highs, dtype=np.float64)
+
+        # ბოლოდან სწორება: row i = [padding | ბოლო lengths[i] ფასი]
+        rows = [np.asarray(h, dtype=history_dtype)[-window:] for h in price_histories]
+        lengths = np.array([len(r) for r in rows], dtype=np.int64)
+        W = int(lengths.max()) if N else 0
+        histories = np.zeros((N, W), dtype=history_dtype)
+        for i, r in enumerate(rows):
+            if len(r):
+                histories[i, W - len(r):] = r
+
+        if NUMBA_AVAILABLE:
+            codes, trend, vol, structural = _analyze_many_nb(
+                prices, histories, lengths, rsis, ema200s
+            )
+        else:
+            codes = np.empty(N, dtype=np.int8)
+            trend = np.empty(N)
+            vol = np.empty(N)
+            structural = np.empty(N, dtype=bool)
+            for i, r in enumerate(rows):
+                returns = np.diff(r) / r[:-1]
+                trend[i] = self._calculate_trend_strength(prices[i], ema200s[i], returns)
+                vol[i] = self._calculate_volatility_percentile(returns)
+                structural[i] = self._is_structural_move(returns, trend[i])
+                codes[i] = self._classify_regime(
+                    trend[i], vol[i], structural[i], rsis[i], prices[i], ema200s[i]
+                ).code
+
+        # confidence — _calculate_confidence-ის vectorized ვერსია
+        bb_range = bb_highs - bb_lows
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bb_pos = np.where(bb_range > 0, (prices - bb_lows) / bb_range, 0.5)
+        warning_count = (vol > 70).astype(np.int64) + (~structural) + (bb_pos > 0.9)
+        confidence = (
+            35.0
+            + np.where(structural, 15.0, -20.0)
+            + np.select([vol > 80, vol > 60, vol < 20], [-25.0, -10.0, 8.0], 0.0)
+            - warning_count * 8
+        )
+        confidence = np.clip(confidence, 15, 75)
+
+        for sym, code in zip(symbols, codes.tolist()):
+            self._push_history(sym, code)
+
+        return RegimeBatch(
+            symbols=list(symbols), codes=codes, confidence=confidence,
+            trend_strength=trend, volatility_percentile=vol, is_structural=structural,
+            prices=prices, bb_lows=bb_lows, bb_highs=bb_highs, detector=self,
+        )
+
+    def _describe(
+        self, trend_strength: float, volatility_percentile: float,
+        is_structural: bool, bb_position: Dict
+    ) -> Tuple[List[str], List[str]]:
+        """reasoning + warning_flags რიცხვითი შედეგებიდან"""
+        reasoning = []
+        warnings = []
+
+        if trend_strength > 0.7:
+            reasoning.append(_FMT_TREND_STRONG_UP(trend_strength))
+        elif trend_strength > 0.3:
+            reasoning.append(_FMT_TREND_UP(trend_strength))
+        elif trend_strength < -0.7:
+            reasoning.append(_FMT_TREND_STRONG_DOWN(trend_strength))
+        elif trend_strength < -0.3:
+            reasoning.append(_FMT_TREND_DOWN(trend_strength))
+        else:
+            reasoning.append(_MSG_FLAT)
+
+        if volatility_percentile > 90:
+            reasoning.append(_MSG_VOL_EXTREME)
+            warnings.append(_WARN_VOL_EXTREME)
+        elif volatility_percentile > 70:
+            reasoning.append(_MSG_VOL_HIGH)
+            warnings.append(_WARN_VOL_HIGH)
+        elif volatility_percentile < 30:
+            reasoning.append(_MSG_VOL_LOW)
+
+        if is_structural:
+            reasoning.append(_MSG_STRUCTURAL)
+        else:
+            reasoning.append(_MSG_NOISE)
+            warnings.append(_WARN_NOISE)
+
+        reasoning.append(bb_position['description'])
+        if bb_position['warning']:
+            warnings.append(bb_position['warning'])
+
+        return reasoning, warnings
+
+    def _calculate_trend_strength(self, price: float, ema200: float, returns: np.ndarray) -> float:
+        if NUMBA_AVAILABLE:
+            return _trend_strength_nb(float(price), float(ema200), returns)
+
         distance_from_ema = (price - ema200) / ema200
 
-        if len(price_history) >= 20:
-            recent_returns = np.diff(price_history[-20:]) / price_history[-20:-1]
-            momentum = np.mean(recent_returns)
+        if len(returns) >= 19:
+            momentum = np.mean(returns[-19:])
         else:
             momentum = 0
 
         trend_score = (distance_from_ema * 2) + (momentum * 100)
-        return np.clip(trend_score, -1, 1)
+        # scalar clip — np.clip 0-d array-ს/numpy scalar-ს ქმნის
+        return -1.0 if trend_score < -1 else 1.0 if trend_score > 1 else float(trend_score)
 
-    def _calculate_volatility_percentile(self, price_history: np.ndarray) -> float:
-        if len(price_history) < 21:
+    def _calculate_volatility_percentile(self, returns: np.ndarray) -> float:
+        if NUMBA_AVAILABLE:
+            return _vol_pct_nb(returns)
+
+        if len(returns) < 20:
             return 50.0
 
-        returns = np.diff(price_history) / price_history[:-1]
         current_vol = np.std(returns[-20:])
         historical_vol = np.std(returns)
 
         percentile = (current_vol / (historical_vol + 1e-10)) * 50
-        return np.clip(percentile, 0, 100)
+        return 0.0 if percentile < 0 else 100.0 if percentile > 100 else float(percentile)
 
-    def _is_structural_move(self, price_history: np.ndarray, trend_strength: float) -> bool:
-        if len(price_history) < 50:
+    def _is_structural_move(self, returns: np.ndarray, trend_strength: float) -> bool:
+        if NUMBA_AVAILABLE:
+            return _structural_nb(returns, float(trend_strength))
+
+        if len(returns) < 49:
             return True
 
-        recent_prices = price_history[-50:]
-        returns = np.diff(recent_prices) / recent_prices[:-1]
+        recent = returns[-49:]   # view — ალოკაცია მხოლოდ bool mask-ზე
 
         if trend_strength > 0:
-            consistency = np.sum(returns > 0) / len(returns)
+            consistency = np.count_nonzero(recent > 0) / 49
         else:
-            consistency = np.sum(returns < 0) / len(returns)
+            consistency = np.count_nonzero(recent < 0) / 49
 
         return consistency > 0.6
 
@@ -192,29 +378,18 @@ class MarketRegimeDetector:
         bb_range = bb_high - bb_low
         position_in_band = (price - bb_low) / bb_range if bb_range > 0 else 0.5
 
-        if position_in_band < 0.1:
-            return {
-                'description': '📉 BB ქვედა ზოლთან (oversold)',
-                'warning': None
-            }
-        elif position_in_band > 0.9:
-            return {
-                'description': '📈 BB ზედა ზოლთან (overbought)',
-                'warning': 'გადახურების რისკი - ძალიან მაღალია'
-            }
-        elif 0.4 <= position_in_band <= 0.6:
-            return {
-                'description': '⚖️ BB შუაში (ნეიტრალური)',
-                'warning': None
-            }
-        else:
-            return {
-                'description': '📊 BB ზოლებში',
-                'warning': None
-            }
+        idx = (0 if position_in_band < 0.1 else
+               3 if position_in_band > 0.9 else
+               1 if 0.4 <= position_in_band <= 0.6 else 2)
+        return _BB_STATES[idx]
 
     def _classify_regime(self, trend_strength: float, volatility_percentile: float,
                         is_structural: bool, rsi: float, price: float, ema200: float) -> MarketRegime:
+        if NUMBA_AVAILABLE:
+            return _REGIME_BY_CODE[_classify_nb(
+                float(trend_strength), float(volatility_percentile), bool(is_structural),
+                float(rsi), float(price), float(ema200)
+            )]
 
         if volatility_percentile > 85:
             return MarketRegime.HIGH_VOLATILITY
@@ -282,19 +457,21 @@ class MarketRegimeDetector:
         confidence -= (warning_count * 8)  # ✅ Heavier (was *5)
 
         # ✅ REALISTIC RANGE
-        return np.clip(confidence, 15, 75)  # ✅ was (20, 100), now (15, 75)
+        return 15.0 if confidence < 15 else 75.0 if confidence > 75 else float(confidence)  # ✅ was (20, 100), now (15, 75)
 
     def get_regime_context(self, symbol: str) -> str:
         if symbol not in self.regime_history:
             return "არ არის ისტორია"
 
-        history = self.regime_history[symbol]
-        if len(history) < 3:
-            return f"მწირი ისტორია ({len(history)} სკანი)"
+        buf, (head,) = self.regime_history[symbol]
+        if head < 3:
+            return f"მწირი ისტორია ({head} სკანი)"
 
-        recent_regimes = [r.value for r in history[-3:]]
+        recent_regimes = [
+            _REGIME_BY_CODE[buf[k % _HISTORY_LEN]].value for k in range(head - 3, head)
+        ]
 
         if len(set(recent_regimes)) == 1:
-            return f"სტაბილური რეჟიმი: {history[-1].value}"
+            return f"სტაბილური რეჟიმი: {recent_regimes[-1]}"
         else:
             return f"რეჟიმის ცვლილება: {' → '.join(recent_regimes)}"
\ No newline at end of file
@@ -8,7 +8,10 @@ v1.0 (Phase 1 Enhanced) unchanged in all other logic
 import numpy as np
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence
+
+from _njit import NUMBA_AVAILABLE
+from _structure_kernels import _sr_levels_nb, _nearest_sr_nb, _nearest_sr_many_nb
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,24 @@ except ImportError:
     MultiTFData = None
 
 
+# regime (Enum ან string) → (tf trend, trend_strength, alignment); ივსება პირველ შეხვედრაზე
+_TREND_BY_REGIME: Dict[object, Tuple[str, float, float]] = {}
+
+
+def _regime_trend(regime) -> Tuple[str, float, float]:
+    hit = _TREND_BY_REGIME.get(regime)
+    if hit is None:
+        trend_str = str(regime).lower()
+        if "bull" in trend_str or "uptrend" in trend_str:
+            hit = ("bullish", 65.0, 85.0)
+        elif "bear" in trend_str or "downtrend" in trend_str:
+            hit = ("bearish", 35.0, 15.0)
+        else:
+            hit = ("neutral", 50.0, 50.0)
+        _TREND_BY_REGIME[regime] = hit
+    return hit
+
+
 @dataclass
 class MarketStructure:
     nearest_support:          float
@@ -46,10 +67,71 @@ class MarketStructure:
     volume_percentile:        float = 50.0
 
 
+class _PriceRing:
+    """
+    symbol-ის ფასების ისტორია: build()-ის history ან update_price()-ით ივსება.
+    update_price წერს in-place ring buffer-ში (append/slice copy-ის გარეშე);
+    view() — ქრონოლოგიური contiguous array, იქმნება მხოლოდ ცვლილების შემდეგ.
+    """
+    __slots__ = ("buf", "head", "filled", "owned", "_view")
+
+    def __init__(self, history: np.ndarray):
+        # caller-ის array პირველ ჩაწერამდე არ კოპირდება (owned=False)
+        self.buf = history
+        self.head = 0
+        self.filled = len(history)
+        self.owned = False
+        self._view = history
+
+    @classmethod
+    def empty(cls, capacity: int, dtype=np.float64) -> "_PriceRing":
+        ring = cls(np.empty(capacity, dtype=dtype))
+        ring.filled = 0
+        ring.owned = True
+        ring._view = None
+        return ring
+
+    def push(self, price: float) -> None:
+        if not self.owned:
+            self.buf = self.buf.copy()
+            self.owned = True
+        cap = len(self.buf)
+        if self.filled < cap:
+            self.buf[self.filled] = price
+            self.filled += 1
+        else:
+            self.buf[self.head] = price
+            self.head = (self.head + 1) % cap
+        self._view = None
+
+    def view(self) -> np.ndarray:
+        if self._view is None:
+            if self.filled < len(self.buf):
+                self._view = self.buf[:self.filled].copy()
+            else:
+                self._view = np.concatenate((self.buf[self.head:], self.buf[:self.head]))
+        return self._view
+
+
 class MarketStructureBuilder:
 
-    def __init__(self):
-        self.price_cache: Dict[str, List[float]] = {}
+    PRICE_RING_SIZE = 200
+    SR_METHODS = ("extrema", "cluster")
+
+    def __init__(self, sr_method: str = "extrema", history_dtype=np.float64):
+        """
+        sr_method: "extrema" — ლოკალური min/max ±window ფანჯარაში (default, v1.0 ლოგიკა);
+                   "cluster" — 20-ბარიანი ფანჯრების min/max-ის clustering (_cluster_sr)
+        history_dtype: np.float32 → price_cache და batch matrix ნახევარი ზომისაა;
+                   დონეები float32 სიზუსტისაა, დანარჩენი არითმეტიკა float64-ში რჩება
+        """
+        if sr_method not in self.SR_METHODS:
+            raise ValueError(f"unknown sr_method: {sr_method}")
+        self.sr_method = sr_method
+        self.history_dtype = np.dtype(history_dtype)
+        self.price_cache: Dict[str, _PriceRing] = {}
+        # symbol → (input key, MarketStructure) — ბოლო შედეგი, იგივე input-ზე ხელახლა არ ითვლება
+        self._structure_cache: Dict[str, Tuple[Tuple, MarketStructure]] = {}
         logger.info("✅ MarketStructureBuilder v2.0 initialized (real multi-TF)")
 
     def build(
@@ -58,31 +140,159 @@ class MarketStructureBuilder:
         current_price: float,
         market_data:   Dict,
         market_regime,
-        price_history: List[float] = None,
+        price_history: Optional[Sequence[float]] = None,
         multi_tf=None,               # ✅ P1/#4 — MultiTFData or None
     ) -> MarketStructure:
 
+        price_history, inputs, key = self._prepare(
+            symbol, current_price, market_data, market_regime, price_history, multi_tf
+        )
+        cached = self._structure_cache.get(symbol)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        structure = self._build(current_price, price_history, *inputs)
+        self._structure_cache[symbol] = (key, structure)
+        return structure
+
+    def update_price(self, symbol: str, price: float) -> None:
+        """ახალი ფასი symbol-ის cache-ში — შემდეგი build(price_history=None) მას გამოიყენებს"""
+        ring = self.price_cache.get(symbol)
+        if ring is None:
+            ring = self.price_cache[symbol] = _PriceRing.empty(self.PRICE_RING_SIZE, self.history_dtype)
+        ring.push(price)
+
+    def build_batch(
+        self,
+        symbols:        Sequence[str],
+        prices:         Sequence[float],
+        market_datas:   Sequence[Dict],
+        market_regimes: Sequence,
+        price_histories: Optional[Sequence] = None,
+        multi_tfs:      Optional[Sequence] = None,
+    ) -> List[MarketStructure]:
+        """
+        build() N symbol-ზე: cache miss-ების support/resistance ერთი batch kernel
+        call-ით (ისტორიები მარცხნიდან padded (N, W) matrix-ში), დანარჩენი — _build.
+        """
+        N = len(symbols)
+        results: List[Optional[MarketStructure]] = [None] * N
+        pending = []
+        for i in range(N):
+            price_history, inputs, key = self._prepare(
+                symbols[i], prices[i], market_datas[i], market_regimes[i],
+                price_histories[i] if price_histories is not None else None,
+                multi_tfs[i] if multi_tfs is not None else None,
+            )
+            cached = self._structure_cache.get(symbols[i])
+            if cached is not None and cached[0] == key:
+                results[i] = cached[1]
+            else:
+                pending.append((i, price_history, inputs, key))
+
+        if not pending:
+            return results
+
+        srs = [None] * len(pending)
+        if NUMBA_AVAILABLE and self.sr_method == "extrema":
+            lengths = np.array([len(p[1]) for p in pending], dtype=np.int64)
+            W = int(lengths.max())
+            histories = np.zeros((len(pending), W), dtype=self.history_dtype)
+            for row, (_, price_history, _, _) in enumerate(pending):
+                histories[row, W - len(price_history):] = price_history
+            cur = np.array([float(prices[p[0]]) for p in pending], dtype=np.float64)
+            support, sup_t, resistance, res_t = _nearest_sr_many_nb(histories, lengths, cur)
+            srs = list(zip(support.tolist(), sup_t.tolist(), resistance.tolist(), res_t.tolist()))
+
+        for (i, price_history, inputs, key), sr in zip(pending, srs):
+            structure = self._build(prices[i], price_history, *inputs, sr=sr)
+            self._structure_cache[symbols[i]] = (key, structure)
+            results[i] = structure
+        return results
+
+    def _prepare(
+        self, symbol: str, current_price: float, market_data: Dict, market_regime,
+        price_history: Optional[Sequence[float]], multi_tf,
+    ) -> Tuple[np.ndarray, Tuple, Tuple]:
+        """(price_history array, _build-ის scalar input-ები, cache key)"""
+        # contiguous history_dtype array ერთხელ — cache-შიც ასე ინახება, ამიტომ support/resistance
+        # kernel-ები, key hash და შემდეგი call-ები აღარ აკონვერტირებენ
         if price_history is None:
-            price_history = self.price_cache.get(symbol, [current_price] * 200)
+            ring = self.price_cache.get(symbol)
+            if ring is not None and ring.filled:
+                price_history = ring.view()
+            else:
+                price_history = np.full(200, current_price, dtype=self.history_dtype)
         else:
-            self.price_cache[symbol] = price_history
+            price_history = np.ascontiguousarray(price_history, dtype=self.history_dtype)
+            self.price_cache[symbol] = _PriceRing(price_history)
+
+        # market_data / regime ველები ერთხელ — key-ც და _build-იც locals-ს იყენებს
+        volume   = market_data.get("volume", 0)
+        avg_vol  = market_data.get("avg_volume_20d", 1)
+        vol_miss = market_data.get("volume_missing", False)
+        ema50    = market_data.get("ema50", current_price)
+        ema200   = market_data.get("ema200", current_price)
+        # regime → (tf trend, strength, alignment) ერთხელ, memoized — key და _build tuple-ს იყენებენ
+        regime_trend  = _regime_trend(getattr(market_regime, "regime", ""))
+        vol_pct       = getattr(market_regime, "volatility_percentile", 50.0)
+        warning_count = len(getattr(market_regime, "warning_flags", []))
+        mtf = None
+        if multi_tf is not None and MULTI_TF_AVAILABLE:
+            mtf = (multi_tf.trend_1h, multi_tf.trend_4h, multi_tf.trend_1d,
+                   multi_tf.alignment_score)
+
+        inputs = (volume, avg_vol, vol_miss, ema50, ema200, regime_trend, vol_pct, warning_count, mtf)
+        # ყველაფერი, რასაც _build კითხულობს — ისტორია content hash-ით
+        key = (
+            current_price, len(price_history), hash(price_history.tobytes()),
+            volume, avg_vol, vol_miss, ema50, ema200,
+            regime_trend, vol_pct, warning_count, mtf,
+        )
+        return price_history, inputs, key
 
-        support_levels, support_strengths = self._find_support_levels(price_history, current_price)
-        nearest_support    = support_levels[0]    if support_levels    else current_price * 0.97
-        support_str_count  = support_strengths[0] if support_strengths else 1
+    def _build(
+        self,
+        current_price: float,
+        price_history: np.ndarray,
+        volume:        float,
+        avg_vol:       float,
+        vol_miss:      bool,
+        ema50:         float,
+        ema200:        float,
+        regime_trend:  Tuple[str, float, float],
+        vol_pct:       float,
+        warning_count: int,
+        mtf:           Optional[Tuple[str, str, str, float]],
+        sr:            Optional[Tuple[float, int, float, int]] = None,
+    ) -> MarketStructure:
+        if sr is not None:
+            # build_batch-მა უკვე დათვალა
+            nearest_support, support_str_count, nearest_resistance, resistance_str_count = sr
+        elif self.sr_method == "cluster":
+            nearest_support, support_str_count, nearest_resistance, resistance_str_count = \
+                self._cluster_sr(price_history, current_price)
+        elif NUMBA_AVAILABLE:
+            # support + resistance ერთ kernel call-ში (მხოლოდ უახლოესი დონეები გვჭირდება)
+            nearest_support, support_str_count, nearest_resistance, resistance_str_count = \
+                _nearest_sr_nb(price_history, float(current_price))
+        else:
+            support_levels, support_strengths = self._find_support_levels(price_history, current_price)
+            nearest_support    = support_levels[0]    if support_levels    else current_price * 0.97
+            support_str_count  = support_strengths[0] if support_strengths else 1
 
-        resistance_levels, resistance_strengths = self._find_resistance_levels(price_history, current_price)
-        nearest_resistance   = resistance_levels[0]    if resistance_levels    else current_price * 1.03
-        resistance_str_count = resistance_strengths[0] if resistance_strengths else 1
+            resistance_levels, resistance_strengths = self._find_resistance_levels(price_history, current_price)
+            nearest_resistance   = resistance_levels[0]    if resistance_levels    else current_price * 1.03
+            resistance_str_count = resistance_strengths[0] if resistance_strengths else 1
 
         support_distance_pct    = ((current_price - nearest_support)    / current_price) * 100
         resistance_distance_pct = ((nearest_resistance - current_price) / current_price) * 100
 
-        volume_trend, volume_momentum = self._analyze_volume_trend(market_data)
+        volume_trend, volume_momentum = self._analyze_volume_trend(volume, avg_vol, vol_miss)
         quality_score = self._calculate_structure_quality(
             support_str_count, resistance_str_count,
             support_distance_pct, resistance_distance_pct,
-            volume_momentum, market_regime
+            volume_momentum, warning_count
         )
 
         pivot_point = (nearest_support + nearest_resistance) / 2
@@ -93,30 +303,16 @@ class MarketStructureBuilder:
         alignment = 50.0
         trend_strength_val = 50.0
 
-        if multi_tf is not None and MULTI_TF_AVAILABLE:
-            tf_1h      = multi_tf.trend_1h
-            tf_4h      = multi_tf.trend_4h
-            tf_1d      = multi_tf.trend_1d
-            alignment  = multi_tf.alignment_score
+        if mtf is not None:
+            tf_1h, tf_4h, tf_1d, alignment = mtf
             # Trend strength from alignment
             trend_strength_val = alignment
         else:
             # Fallback: derive from regime only (v1.0 behaviour)
-            trend_str = str(getattr(market_regime, "regime", "")).lower()
-            if "bull" in trend_str or "uptrend" in trend_str:
-                tf_1h = tf_4h = tf_1d = "bullish"
-                trend_strength_val = 65.0
-                alignment = 85.0
-            elif "bear" in trend_str or "downtrend" in trend_str:
-                tf_1h = tf_4h = tf_1d = "bearish"
-                trend_strength_val = 35.0
-                alignment = 15.0
-            else:
-                alignment = 50.0
-                trend_strength_val = 50.0
+            tf_1h, trend_strength_val, alignment = regime_trend
+            tf_4h = tf_1d = tf_1h
 
         # Volatility from regime
-        vol_pct = getattr(market_regime, "volatility_percentile", 50.0)
         if vol_pct > 80:
             vol_regime = "high"
         elif vol_pct > 50:
@@ -125,8 +321,6 @@ class MarketStructureBuilder:
             vol_regime = "low"
 
         # Momentum score from price vs EMA
-        ema50 = market_data.get("ema50", current_price)
-        ema200 = market_data.get("ema200", current_price)
         mom_score = 50.0
         if ema50 > 0 and ema200 > 0:
             vs50  = (current_price - ema50)  / ema50  * 100
@@ -135,8 +329,6 @@ class MarketStructureBuilder:
             mom_score = max(0.0, min(100.0, mom_score))
 
         # Volume percentile
-        volume    = market_data.get("volume", 0)
-        avg_vol   = market_data.get("avg_volume_20d", 1)
         vol_ratio = volume / avg_vol if avg_vol > 0 and volume > 0 else 1.0
         vol_percentile = min(100.0, vol_ratio * 50.0)
 
@@ -163,64 +355,113 @@ class MarketStructureBuilder:
             volume_percentile=vol_percentile,
         )
 
-    # ─── Support / Resistance detection (unchanged from v1.0) ─────────────
+    # ─── Support / Resistance detection ───────────────────────────────────
 
     def _find_support_levels(
-        self, price_history: List[float], current_price: float
+        self, price_history, current_price: float
     ) -> Tuple[List[float], List[int]]:
         if len(price_history) < 10:
             return [current_price * 0.97], [1]
 
-        prices = np.array(price_history)
-        support_levels = []
-        support_strengths = []
-
-        window = max(5, len(prices) // 20)
-        for i in range(window, len(prices) - window):
-            if prices[i] == min(prices[max(0, i-window):i+window+1]):
-                if prices[i] < current_price:
-                    touches = sum(1 for p in prices if abs(p - prices[i]) / prices[i] < 0.015)
-                    support_levels.append(float(prices[i]))
-                    support_strengths.append(touches)
-
-        if not support_levels:
+        levels, strengths = self._extrema_levels(price_history, current_price, find_min=True)
+        if not levels:
             return [current_price * 0.97], [1]
-
-        # Sort by proximity to current price
-        paired = sorted(zip(support_levels, support_strengths),
-                        key=lambda x: abs(x[0] - current_price))
-        return [p[0] for p in paired[:5]], [p[1] for p in paired[:5]]
+        return levels, strengths
 
     def _find_resistance_levels(
-        self, price_history: List[float], current_price: float
+        self, price_history, current_price: float
     ) -> Tuple[List[float], List[int]]:
         if len(price_history) < 10:
             return [current_price * 1.03], [1]
 
-        prices = np.array(price_history)
-        resistance_levels = []
-        resistance_strengths = []
-
-        window = max(5, len(prices) // 20)
-        for i in range(window, len(prices) - window):
-            if prices[i] == max(prices[max(0, i-window):i+window+1]):
-                if prices[i] > current_price:
-                    touches = sum(1 for p in prices if abs(p - prices[i]) / prices[i] < 0.015)
-                    resistance_levels.append(float(prices[i]))
-                    resistance_strengths.append(touches)
-
-        if not resistance_levels:
+        levels, strengths = self._extrema_levels(price_history, current_price, find_min=False)
+        if not levels:
             return [current_price * 1.03], [1]
+        return levels, strengths
 
-        paired = sorted(zip(resistance_levels, resistance_strengths),
-                        key=lambda x: abs(x[0] - current_price))
-        return [p[0] for p in paired[:5]], [p[1] for p in paired[:5]]
-
-    def _analyze_volume_trend(self, market_data: Dict) -> Tuple[str, float]:
-        volume    = market_data.get("volume", 0)
-        avg_vol   = market_data.get("avg_volume_20d", 1)
-        vol_miss  = market_data.get("volume_missing", False)
+    @staticmethod
+    def _extrema_levels(
+        price_history, current_price: float, find_min: bool
+    ) -> Tuple[List[float], List[int]]:
+        """
+        ლოკალური min/max ±window ფანჯარაში (sliding_window_view, Python loop-ის გარეშე),
+        current_price-ის ქვემოთ (support) / ზემოთ (resistance). touches = ფასები ±1.5%-ში.
+        აბრუნებს ≤5 დონეს current_price-თან სიახლოვის მიხედვით.
+        """
+        # float32 cache array რჩება float32 (kernel-ს f4 signature აქვს), სხვა → float64
+        dtype = np.float32 if getattr(price_history, "dtype", None) == np.float32 else np.float64
+        if NUMBA_AVAILABLE:
+            levels, touches = _sr_levels_nb(
+                np.ascontiguousarray(price_history, dtype=dtype),
+                float(current_price), find_min
+            )
+            return levels.tolist(), touches.tolist()
+
+        prices = np.asarray(price_history, dtype=dtype)
+        window = max(5, len(prices) // 20)
+        if len(prices) <= 2 * window:
+            return [], []
 
+        windows = np.lib.stride_tricks.sliding_window_view(prices, 2 * window + 1)
+        centre = prices[window:len(prices) - window]
+        if find_min:
+            mask = (centre == windows.min(axis=1)) & (centre < current_price)
+        else:
+            mask = (centre == windows.max(axis=1)) & (centre > current_price)
+        levels = centre[mask]
+        if not levels.size:
+            return [], []
+
+        # Sort by proximity to current price (stable — თანაბარ მანძილზე თავდაპირველი რიგი).
+        # > 5 კანდიდატი → ჯერ O(n) partition: მე-5 მანძილამდე (tie-ების ჩათვლით) რჩება
+        dist = np.abs(levels - current_price)
+        if levels.size > 5:
+            keep = np.flatnonzero(dist <= np.partition(dist, 4)[4])
+            levels, dist = levels[keep], dist[keep]
+        levels = levels[np.argsort(dist, kind="stable")[:5]]
+
+        # touches მხოლოდ დაბრუნებულ (≤5) დონეზე — ერთი (levels × prices) broadcast + reduction
+        touches = np.count_nonzero(
+            np.abs(prices[None, :] - levels[:, None]) / levels[:, None] < 0.015, axis=1
+        )
+        return levels.tolist(), touches.tolist()
+
+    @staticmethod
+    def _cluster_sr(
+        price_history: np.ndarray, current_price: float
+    ) -> Tuple[float, int, float, int]:
+        """
+        ბოლო ≤200 ბარი → 20-ბარიანი ფანჯრების min/max → sort → ჯგუფები, სადაც
+        მეზობლებს შორის < 4% × price. ჯგუფის საშუალო = დონე, ზომა = strength.
+        აბრუნებს უახლოეს support/resistance-ს (default-ები იგივეა რაც extrema-ში).
+        """
+        support, sup_str = current_price * 0.97, 1
+        resistance, res_str = current_price * 1.03, 1
+
+        n_windows = min(len(price_history), 200) // 20
+        if n_windows < 2:
+            return support, sup_str, resistance, res_str
+
+        windowed = price_history[-n_windows * 20:].reshape(n_windows, 20)
+        points = np.sort(np.concatenate((windowed.min(axis=1), windowed.max(axis=1))))
+        breaks = np.flatnonzero(np.diff(points) >= 0.04 * current_price) + 1
+        starts = np.concatenate(([0], breaks))
+        sizes = np.diff(np.concatenate((starts, [len(points)])))
+        means = np.add.reduceat(points, starts) / sizes
+
+        below = np.flatnonzero(means < current_price)
+        if below.size:
+            k = below[-1]                       # means დალაგებულია → ბოლო = უახლოესი
+            support, sup_str = float(means[k]), int(sizes[k])
+        above = np.flatnonzero(means > current_price)
+        if above.size:
+            k = above[0]
+            resistance, res_str = float(means[k]), int(sizes[k])
+        return support, sup_str, resistance, res_str
+
+    def _analyze_volume_trend(
+        self, volume: float, avg_vol: float, vol_miss: bool
+    ) -> Tuple[str, float]:
         if vol_miss or avg_vol == 0:
             return "unknown", 0.0
 
@@ -236,7 +477,7 @@ class MarketStructureBuilder:
         support_dist: float,
         resistance_dist: float,
         volume_momentum: float,
-        market_regime,
+        warning_count: int,
     ) -> float:
         quality = 50.0
         quality += min(support_strength * 5, 20)
@@ -245,6 +486,5 @@ class MarketStructureBuilder:
         if 2 < resistance_dist < 10: quality += 10
         if volume_momentum > 1.2:   quality += 10
         elif volume_momentum < 0.8: quality -= 10
-        warnings = getattr(market_regime, "warning_flags", [])
-        quality -= len(warnings) * 5
+        quality -= warning_count * 5
         return max(0.0, min(100.0, quality))
\ No newline at end of file
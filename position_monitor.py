@@ -11,11 +11,14 @@ POSITION MONITOR v2.0
 """
 
 import asyncio
+import itertools
 import logging
 from datetime import datetime
-from typing import Optional, Dict
+import numpy as np
+from typing import Optional, Dict, List, Tuple
 
-from config import get_tier_risk, ANTHROPIC_API_KEY
+from config import get_tier, get_tier_risk, ANTHROPIC_API_KEY
+from sell_signal_message_generator import SellSignalMessageGenerator
 
 try:
     from signal_history_db import SignalHistoryDB, SignalResult, SignalStatus
@@ -25,62 +28,107 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
-# AI Exit Evaluator — optional
+# Binance WebSocket price stream — optional
 try:
-    from ai_exit_evaluator import AIExitEvaluator
-    AI_EXIT_AVAILABLE = True
+    from price_stream import PriceStream
+    PRICE_STREAM_AVAILABLE = True
 except Exception as e:
-    AI_EXIT_AVAILABLE = False
-    logger.warning(f"⚠️ AIExitEvaluator not available: {e}")
+    PRICE_STREAM_AVAILABLE = False
+    logger.warning(f"⚠️ PriceStream not available: {e}")
 
-# Signal Memory — optional
-try:
-    from signal_memory import SignalMemory
-    MEMORY_AVAILABLE = True
-except Exception as e:
-    MEMORY_AVAILABLE = False
-    logger.warning(f"⚠️ SignalMemory not available: {e}")
+# AI Exit Evaluator (anthropic client) და SignalMemory — optional და lazy:
+# import/init start_monitoring-ზე (_lazy_init_ai), არა ამ module-ის import-ისას
 
 
 class PositionMonitor:
 
+    # Telegram exit შეტყობინებები — buffer, flush ყოველ 3s-ში ან N-ზე;
+    # ერთი asset-ის მესიჯები ერთ message-ში (Telegram limit 4096 + footer)
+    TG_FLUSH_INTERVAL = 3.0
+    TG_MAX_BUFFER     = 20
+    TG_MAX_CHARS      = 4000
+    TG_SEPARATOR      = "\n---\n"
+
+    # AI partial exit trigger — target-ის რამდენი % გაიარა ფასმა
+    PARTIAL_EXIT_PROGRESS = 70.0
+
+    # AI exit eval — priority queue (progress desc), სავსე → reject (შემდეგი tick ცდის)
+    AI_QUEUE_SIZE  = 5
+    AI_CONCURRENCY = 3
+
+    # event loop lag probe — sync მუშაობა (sqlite, analyze_exit ...) რომ loop-ს ბლოკავს
+    LAG_PROBE_INTERVAL = 1.0
+    LAG_WARN_MS        = 50.0
+
     def __init__(
         self,
         exit_handler,
         data_provider,
         telegram_handler,
         analytics_db,
-        scan_interval: int = 60
+        scan_interval: int = 60,
+        max_concurrency: int = 16,
+        use_price_stream: bool = True
     ):
         self.exit_handler     = exit_handler
         self.data_provider    = data_provider
         self.telegram_handler = telegram_handler
         self.analytics_db     = analytics_db
         self.scan_interval    = scan_interval
+        self.max_concurrency  = max_concurrency
+
+        # tick path-ის bound method-ები / dict ერთხელ — ყოველ tick-ზე attribute lookup აღარ
+        # (active_positions dict ExitHandler-ში არასდროს იცვლება, მხოლოდ მუტირდება)
+        self._positions    = exit_handler.active_positions
+        self._update_price = exit_handler.update_price
+        self._check_exit   = exit_handler.check_exit_condition
         self.is_monitoring    = False
         self.monitoring_task  = None
+        self.stream_task      = None
+        self._lag_task        = None
+        self.loop_lag_ms      = 0.0     # ბოლო გაზომვა
+        self.max_loop_lag_ms  = 0.0     # monitoring-ის დაწყებიდან
+
+        # analytics performance ჩანაწერები — background flusher წერს batch-ებად
+        self._analytics_queue: Optional[asyncio.Queue] = None
+        self._analytics_task  = None
+
+        # Telegram broadcast buffer: (asset, message)
+        self._tg_buffer: List[Tuple[str, str]] = []
+        self._tg_wake    = asyncio.Event()
+        self._tg_flusher = None
+
+        # WS ticker — crypto position-ების exit check ყოველ tick-ზე;
+        # 60s poll რჩება watchdog-ად და non-crypto symbol-ებისთვის
+        self.price_stream = None
+        symbol_map = getattr(data_provider, "symbol_map", None)
+        if use_price_stream and PRICE_STREAM_AVAILABLE and symbol_map is not None:
+            self.price_stream = PriceStream(
+                lambda s: symbol_map.get(s, (None, None, None))[2]
+            )
 
-        # AI Exit Evaluator
-        self.ai_exit = None
-        if AI_EXIT_AVAILABLE and ANTHROPIC_API_KEY:
-            try:
-                self.ai_exit = AIExitEvaluator(api_key=ANTHROPIC_API_KEY)
-                logger.info("✅ AIExitEvaluator ready")
-            except Exception as e:
-                logger.warning(f"⚠️ AIExitEvaluator init failed: {e}")
+        # symbol-ები, რომელთა exit ახლა მუშავდება (poll და stream ერთდროულად არ ხურავს)
+        self._exiting: set = set()
 
-        # Signal Memory
+        # AI Exit Evaluator / Signal Memory — _lazy_init_ai (start_monitoring)
+        self.ai_exit = None
         self.signal_memory = None
-        if MEMORY_AVAILABLE:
-            try:
-                self.signal_memory = SignalMemory()
-                logger.info("✅ SignalMemory ready")
-            except Exception as e:
-                logger.warning(f"⚠️ SignalMemory init failed: {e}")
+        self._actionable_advice: tuple = ()   # (TAKE_PARTIAL, TAKE_FULL) lazy init-ის შემდეგ
+        self._ai_initialized = False
 
         # Track which positions already got AI exit advice (avoid spam)
         self._exit_advised: set = set()
 
+        # AI exit eval queue + workers (start_monitoring ქმნის)
+        self._ai_queue: Optional[asyncio.PriorityQueue] = None
+        self._ai_workers: List[asyncio.Task] = []
+        self._ai_pending: set = set()       # რიგში ან შეფასების პროცესში
+        self._ai_seq = itertools.count()    # tie-breaker თანაბარ progress-ზე
+
+        # symbol → (entry_time str, parsed datetime) — fromisoformat ერთხელ position-ზე;
+        # str-ის შედარება ამოწმებს, რომ იგივე position-ია (restart/ხელახალი open)
+        self._entry_dt: Dict[str, Tuple[str, datetime]] = {}
+
         # Signal history DB for recording exits
         self.signal_history_db = None
         if SIG_HISTORY_AVAILABLE:
@@ -89,7 +137,31 @@ class PositionMonitor:
             except Exception:
                 pass
 
-        logger.info(f"✅ PositionMonitor v2.0 | interval={scan_interval}s | "
+        logger.info(f"✅ PositionMonitor v2.0 | interval={scan_interval}s")
+
+    def _lazy_init_ai(self):
+        """AIExitEvaluator + SignalMemory — პირველ start_monitoring-ზე, ერთხელ"""
+        if self._ai_initialized:
+            return
+        self._ai_initialized = True
+
+        if ANTHROPIC_API_KEY:
+            try:
+                from ai_exit_evaluator import AIExitEvaluator, ExitAdvice
+                self.ai_exit = AIExitEvaluator(api_key=ANTHROPIC_API_KEY)
+                self._actionable_advice = (ExitAdvice.TAKE_PARTIAL, ExitAdvice.TAKE_FULL)
+                logger.info("✅ AIExitEvaluator ready")
+            except Exception as e:
+                logger.warning(f"⚠️ AIExitEvaluator not available: {e}")
+
+        try:
+            from signal_memory import SignalMemory
+            self.signal_memory = SignalMemory()
+            logger.info("✅ SignalMemory ready")
+        except Exception as e:
+            logger.warning(f"⚠️ SignalMemory not available: {e}")
+
+        logger.info(f"🤖 PositionMonitor services | "
                     f"AI Exit: {'✅' if self.ai_exit else '❌'} | "
                     f"Memory: {'✅' if self.signal_memory else '❌'}")
 
@@ -100,18 +172,56 @@ class PositionMonitor:
     async def start_monitoring(self):
         if self.is_monitoring:
             return
+        self._lazy_init_ai()
         self.is_monitoring   = True
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
+        self._lag_task       = asyncio.create_task(self._lag_probe())
+        if self.analytics_db:
+            self._analytics_queue = asyncio.Queue(maxsize=10_000)
+            self._analytics_task  = asyncio.create_task(self._analytics_flusher())
+        if self.telegram_handler:
+            self._tg_flusher = asyncio.create_task(self._telegram_flusher())
+        if self.ai_exit:
+            self._ai_queue   = asyncio.PriorityQueue(maxsize=self.AI_QUEUE_SIZE)
+            self._ai_workers = [asyncio.create_task(self._ai_worker())
+                                for _ in range(self.AI_CONCURRENCY)]
+        if self.price_stream:
+            await self.price_stream.set_symbols(self.exit_handler.active_positions)
+            self.price_stream.start()
+            self.stream_task = asyncio.create_task(self._stream_consumer())
         logger.info("🔍 Position monitoring started")
 
     async def stop_monitoring(self):
         self.is_monitoring = False
-        if self.monitoring_task:
-            self.monitoring_task.cancel()
+        for task in (self.monitoring_task, self.stream_task, self._lag_task, *self._ai_workers):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._ai_workers = []
+        self._ai_queue   = None
+        self._ai_pending.clear()
+        if self.price_stream:
+            await self.price_stream.stop()
+        if self._analytics_task:
+            self._analytics_task.cancel()
             try:
-                await self.monitoring_task
+                await self._analytics_task
             except asyncio.CancelledError:
                 pass
+            self._analytics_task = None
+            await self._flush_analytics()   # რაც რიგში დარჩა
+            self._analytics_queue = None
+        if self._tg_flusher:
+            self._tg_flusher.cancel()
+            try:
+                await self._tg_flusher
+            except asyncio.CancelledError:
+                pass
+            self._tg_flusher = None
+            await self._flush_telegram()    # რაც buffer-ში დარჩა
         logger.info("🛑 Position monitoring stopped")
 
     async def _monitoring_loop(self):
@@ -125,50 +235,240 @@ class PositionMonitor:
                 logger.error(f"❌ Monitoring loop error: {e}")
                 await asyncio.sleep(10)
 
+    async def _lag_probe(self):
+        """sleep(interval)-ის რეალური ხანგრძლივობა − interval = loop-ის დაგვიანება"""
+        interval = self.LAG_PROBE_INTERVAL
+        clock = asyncio.get_running_loop().time
+        while True:
+            t0 = clock()
+            await asyncio.sleep(interval)
+            lag_ms = (clock() - t0 - interval) * 1000
+            self.loop_lag_ms = lag_ms
+            if lag_ms > self.max_loop_lag_ms:
+                self.max_loop_lag_ms = lag_ms
+            if lag_ms > self.LAG_WARN_MS:
+                logger.warning("🐢 Event loop lag %.1fms", lag_ms)
+
     # ═══════════════════════════════════════════════════════════════════════
     # POSITION CHECK
     # ═══════════════════════════════════════════════════════════════════════
 
+    async def _analytics_flusher(self):
+        """ერთ ჩანაწერს ელოდება, შემდეგ რიგს ბოლომდე ცლის და ერთ transaction-ში წერს"""
+        while True:
+            first = await self._analytics_queue.get()
+            await self._flush_analytics([first])
+
+    async def _flush_analytics(self, batch: Optional[list] = None):
+        batch = batch or []
+        queue = self._analytics_queue
+        while queue is not None and not queue.empty():
+            batch.append(queue.get_nowait())
+        if not batch:
+            return
+        try:
+            # sqlite sync-ია — thread-ში, რომ monitoring loop არ დაიბლოკოს
+            await asyncio.to_thread(self.analytics_db.record_performance_many, batch)
+        except Exception as e:
+            logger.error(f"❌ Analytics record error: {e}")
+
+    # ═══════════════════════════════════════════════════════════════════════
+    # TELEGRAM BATCHING
+    # ═══════════════════════════════════════════════════════════════════════
+
+    async def _send_telegram(self, message: str, asset: str):
+        """flusher მუშაობს → buffer-ში; თორემ პირდაპირ broadcast"""
+        if self._tg_flusher is None:
+            await self.telegram_handler.broadcast_signal(message=message, asset=asset)
+            return
+        self._tg_buffer.append((asset, message))
+        if len(self._tg_buffer) >= self.TG_MAX_BUFFER:
+            self._tg_wake.set()
+
+    async def _telegram_flusher(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._tg_wake.wait(), self.TG_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._tg_wake.clear()
+            await self._flush_telegram()
+
+    async def _flush_telegram(self):
+        if not self._tg_buffer:
+            return
+        batch, self._tg_buffer = self._tg_buffer, []
+
+        by_asset: Dict[str, List[str]] = {}
+        for asset, message in batch:
+            by_asset.setdefault(asset, []).append(message)
+
+        for asset, messages in by_asset.items():
+            for chunk in self._pack_messages(messages):
+                try:
+                    await self.telegram_handler.broadcast_signal(message=chunk, asset=asset)
+                except Exception as e:
+                    logger.error(f"❌ Telegram broadcast error {asset}: {e}")
+
+    @classmethod
+    def _pack_messages(cls, messages: List[str]) -> List[str]:
+        """separator-ით აწებებს TG_MAX_CHARS-მდე; ზედმეტად გრძელი მესიჯი იჭრება"""
+        limit, sep = cls.TG_MAX_CHARS, cls.TG_SEPARATOR
+        chunks: List[str] = []
+        current = ""
+        for message in messages:
+            for i in range(0, max(len(message), 1), limit):
+                part = message[i:i + limit]
+                if current and len(current) + len(sep) + len(part) <= limit:
+                    current += sep + part
+                else:
+                    if current:
+                        chunks.append(current)
+                    current = part
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _stream_consumer(self):
+        queue = self.price_stream.queue
+        while self.is_monitoring:
+            try:
+                symbol, price = await queue.get()
+                await self._process_price(
+                    symbol, price, datetime.now().isoformat(), fast_path=True
+                )
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error("❌ Stream tick error: %s", e)
+
     async def _check_all_positions(self):
-        symbols = list(self.exit_handler.active_positions.keys())
+        # snapshot აუცილებელია — gather-ის დროს exit-ები dict-იდან შლის;
+        # tuple: over-allocation-ის გარეშე
+        symbols = tuple(self.exit_handler.active_positions)
+        if self.price_stream:
+            # ახალი position-ები subscribe, დახურულები unsubscribe
+            await self.price_stream.set_symbols(symbols)
         if not symbols:
             return
-        logger.debug(f"🔍 Monitoring {len(symbols)} positions")
-        for symbol in symbols:
+        logger.debug("🔍 Monitoring %d positions", len(symbols))
+
+        # ყველა ფასი ერთი fetch_many batch-ით (indicators ერთ vectorized pass-ში);
+        # batch-იდან გამორჩენილი symbol → ცალკე fetch_with_fallback
+        md_map: Dict = {}
+        fetch_many = getattr(self.data_provider, "fetch_many", None)
+        if fetch_many is not None:
             try:
-                await self._check_single_position(symbol)
+                md_map = await fetch_many(symbols, batch_size=self.max_concurrency)
             except Exception as e:
-                logger.error(f"❌ Error checking {symbol}: {e}")
+                logger.warning("⚠️ Batch fetch failed, per-symbol fallback: %s", e)
+
+        # ყველა position პარალელურად — tick-ის დრო ≈ ერთი RTT და არა N × RTT;
+        # semaphore ზღუდავს ერთდროულ fallback fetch-ებს provider-ის rate limit-ისთვის
+        sem = asyncio.Semaphore(self.max_concurrency)
+        now_iso = datetime.now().isoformat()   # ერთი timestamp მთელ tick-ზე
 
-    async def _check_single_position(self, symbol: str):
+        async def _guarded(symbol: str):
+            async with sem:
+                return await self._check_single_position(symbol, now_iso, md_map.get(symbol))
+
+        results = await asyncio.gather(
+            *(_guarded(s) for s in symbols), return_exceptions=True
+        )
+        open_ticks = []
+        for symbol, res in zip(symbols, results):
+            if isinstance(res, Exception):
+                logger.error("❌ Error checking %s: %s", symbol, res)
+            elif res is not None:
+                open_ticks.append(res)
+
+        # AI partial exit — progress ყველა ღია position-ზე ერთი NumPy pass-ით,
+        # AI-ს მხოლოდ trigger-ს გადაცილებული symbol-ები ეგზავნება
+        if self.ai_exit and open_ticks:
+            ticks = [open_ticks[i] for i in self._partial_exit_candidates(open_ticks)]
+            results = await asyncio.gather(
+                *(self._check_partial_exit(sym, price, md) for sym, price, md in ticks),
+                return_exceptions=True
+            )
+            for (symbol, _, _), res in zip(ticks, results):
+                if isinstance(res, Exception):
+                    logger.error("❌ Partial exit check error %s: %s", symbol, res)
+
+    def _partial_exit_candidates(self, ticks: List[Tuple[str, float, object]]) -> np.ndarray:
+        """(symbol, price, md) სია → index-ები, სადაც progress >= PARTIAL_EXIT_PROGRESS"""
+        positions = self.exit_handler.active_positions
+        rows = [
+            (i, positions[sym]["entry_price"], positions[sym]["target_price"], price)
+            for i, (sym, price, _) in enumerate(ticks)
+            if sym not in self._exit_advised and sym in positions
+        ]
+        if not rows:
+            return np.empty(0, dtype=np.intp)
+        idx = np.fromiter((r[0] for r in rows), dtype=np.intp, count=len(rows))
+        entries, targets, prices = np.array([r[1:] for r in rows], dtype=np.float64).T
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            max_profit = (targets - entries) / entries * 100
+            profit     = (prices  - entries) / entries * 100
+            progress   = np.where(max_profit > 0, profit / max_profit * 100, 0.0)
+        return idx[progress >= self.PARTIAL_EXIT_PROGRESS]
+
+    async def _check_single_position(
+        self, symbol: str, current_time: Optional[str] = None, md=None
+    ) -> Optional[Tuple[str, float, object]]:
+        """fetch + exit check; position ღია რჩება → (symbol, price, md) partial exit-ისთვის"""
         if not self.data_provider:
-            return
+            return None
 
         try:
-            md = await self.data_provider.fetch_with_fallback(symbol)
+            if md is None:
+                md = await self.data_provider.fetch_with_fallback(symbol)
             if not md:
                 return
             current_price = md.price
-            current_time  = datetime.now().isoformat()
+            if current_time is None:
+                current_time = datetime.now().isoformat()
         except Exception as e:
-            logger.debug(f"⚠️ Price fetch failed {symbol}: {e}")
+            logger.debug("⚠️ Price fetch failed %s: %s", symbol, e)
             return
 
-        self.exit_handler.update_price(symbol, current_price, current_time)
+        # ── Exit condition check (AI partial exit — _check_all_positions-ში) ──
+        if await self._process_price(symbol, current_price, current_time):
+            return None
+        return symbol, current_price, md
 
-        # ── 1. Exit condition check ───────────────────────────────────────
-        exit_reason, exit_price = self.exit_handler.check_exit_condition(
-            symbol=symbol,
-            current_price=current_price,
-            current_time=current_time
-        )
+    async def _process_price(
+        self, symbol: str, current_price: float, current_time: str, fast_path: bool = False
+    ) -> bool:
+        """
+        update_price + exit check — poll-იც და stream tick-იც ამას იძახებს.
+        True → position დაიხურა (ან უკვე აღარ არის / იხურება).
+        fast_path (stream tick): ფასი stop/trailing-სა და target-ს შორისაა →
+        check_exit_condition გამოტოვებულია; TIMEOUT-ს 60s poll-ის სრული check იჭერს.
+        """
+        pos = self._positions.get(symbol)
+        if pos is None or symbol in self._exiting:
+            return True
 
-        if exit_reason is not None:
-            await self._handle_position_exit(symbol, exit_reason, exit_price, current_time)
-            return
+        self._update_price(symbol, current_price, current_time)
+
+        if fast_path:
+            floor = pos["stop_loss_price"]
+            if pos.get("trailing_active") and pos["trailing_stop"] > floor:
+                floor = pos["trailing_stop"]
+            if floor < current_price < pos["target_price"]:
+                return False
+
+        exit_reason, exit_price = self._check_exit(symbol, current_price, current_time)
+        if exit_reason is None:
+            return False
 
-        # ── 2. AI Partial Exit check ──────────────────────────────────────
-        await self._check_partial_exit(symbol, current_price, md)
+        self._exiting.add(symbol)
+        try:
+            await self._handle_position_exit(symbol, exit_reason, exit_price, current_time)
+        finally:
+            self._exiting.discard(symbol)
+        return True
 
     # ═══════════════════════════════════════════════════════════════════════
     # AI PARTIAL EXIT
@@ -178,11 +478,12 @@ class PositionMonitor:
         """
         target-ის 70%-ზე მიღწევისას AI-ს ეკითხება:
         HOLD_ALL / TAKE_PARTIAL / TAKE_FULL
+        worker-ები მუშაობს → request რიგში (progress desc), თორემ პირდაპირ
         """
         if not self.ai_exit:
             return
-        if symbol in self._exit_advised:
-            return  # უკვე ვუთხარით ამ position-ზე
+        if symbol in self._exit_advised or symbol in self._ai_pending:
+            return  # უკვე ვუთხარით ამ position-ზე / უკვე რიგშია
 
         pos = self.exit_handler.active_positions.get(symbol)
         if not pos:
@@ -198,12 +499,12 @@ class PositionMonitor:
         progress       = profit_pct / max_profit_pct * 100 if max_profit_pct > 0 else 0
 
         # Trigger: 70%+ of target reached
-        if progress < 70:
+        if progress < self.PARTIAL_EXIT_PROGRESS:
             return
 
         # Hold duration
         try:
-            entry_dt  = datetime.fromisoformat(pos["entry_time"])
+            entry_dt  = self._entry_datetime(symbol, pos["entry_time"])
             hold_h    = (datetime.now() - entry_dt).total_seconds() / 3600
         except Exception:
             hold_h = 0
@@ -223,36 +524,57 @@ class PositionMonitor:
             "avg_volume_20d":      getattr(md, "avg_volume_20d", 1_000_000),
         }
 
+        request = dict(
+            symbol=symbol,
+            entry_price=entry_price,
+            current_price=current_price,
+            target_price=target_price,
+            stop_loss=stop_loss,
+            strategy=strategy,
+            tier=tier,
+            hold_hours=hold_h,
+            indicators=indicators,
+            symbol_history=history_str,
+        )
+
+        if self._ai_queue is None:
+            await self._evaluate_partial_exit(request, profit_pct)
+            return
         try:
-            evaluation = await self.ai_exit.evaluate_exit(
-                symbol=symbol,
-                entry_price=entry_price,
-                current_price=current_price,
-                target_price=target_price,
-                stop_loss=stop_loss,
-                strategy=strategy,
-                tier=tier,
-                hold_hours=hold_h,
-                indicators=indicators,
-                symbol_history=history_str,
-            )
+            self._ai_queue.put_nowait((-progress, next(self._ai_seq), request, profit_pct))
+            self._ai_pending.add(symbol)
+        except asyncio.QueueFull:
+            logger.debug("⏳ AI exit queue full, %s retried next tick", symbol)
+
+    async def _ai_worker(self):
+        while True:
+            _, _, request, profit_pct = await self._ai_queue.get()
+            symbol = request["symbol"]
+            try:
+                # რიგში ყოფნისას position შეიძლება დაიხურა
+                if symbol in self.exit_handler.active_positions:
+                    await self._evaluate_partial_exit(request, profit_pct)
+            finally:
+                self._ai_pending.discard(symbol)
+
+    async def _evaluate_partial_exit(self, request: Dict, profit_pct: float):
+        symbol = request["symbol"]
+        try:
+            evaluation = await self.ai_exit.evaluate_exit(**request)
 
             # Only send if actionable
-            from ai_exit_evaluator import ExitAdvice
-            if evaluation.advice in (ExitAdvice.TAKE_PARTIAL, ExitAdvice.TAKE_FULL):
+            if evaluation.advice in self._actionable_advice:
                 msg = self.ai_exit.format_telegram_message(
                     symbol=symbol,
                     profit_pct=profit_pct,
                     evaluation=evaluation,
-                    entry_price=entry_price,
-                    current_price=current_price,
+                    entry_price=request["entry_price"],
+                    current_price=request["current_price"],
                 )
 
                 if self.telegram_handler:
-                    await self.telegram_handler.broadcast_signal(
-                        message=msg, asset=symbol
-                    )
-                    logger.info(f"📊 Partial exit advice sent: {symbol} {evaluation.advice.value}")
+                    await self._send_telegram(msg, symbol)
+                    logger.info(f"📊 Partial exit advice queued: {symbol} {evaluation.advice.value}")
 
             # Mark as advised — no repeat for this position
             self._exit_advised.add(symbol)
@@ -276,81 +598,111 @@ class PositionMonitor:
         if not exit_analysis:
             return
 
-        # ── Telegram SELL message ─────────────────────────────────────────
-        if self.telegram_handler:
-            try:
-                from sell_signal_message_generator import SellSignalMessageGenerator
-                msg = SellSignalMessageGenerator.generate_sell_message(
-                    symbol=symbol, exit_analysis=exit_analysis
+        # telegram / analytics / memory / history ერთმანეთისგან დამოუკიდებელია —
+        # პარალელურად; თითო helper თავის შეცდომას თვითონ იჭერს და group-ს არ აუქმებს
+        pos = self.exit_handler.active_positions.get(symbol)
+        async with asyncio.TaskGroup() as group:
+            if self.telegram_handler:
+                group.create_task(self._send_sell_message(symbol, exit_analysis))
+            if self.analytics_db:
+                group.create_task(
+                    self._record_analytics(pos, exit_analysis, exit_reason, exit_time)
                 )
-                await self.telegram_handler.broadcast_signal(message=msg, asset=symbol)
-                logger.info(f"📤 SELL signal sent: {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Sell message error: {e}")
-
-        # ── Analytics ────────────────────────────────────────────────────
-        if self.analytics_db:
-            try:
-                pos = self.exit_handler.active_positions.get(symbol)
-                if pos and pos.get("signal_id"):
-                    self.analytics_db.record_performance(
-                        signal_id=pos["signal_id"],
-                        outcome="SUCCESS" if exit_analysis.profit_pct > 0 else "FAILURE",
-                        final_profit_pct=exit_analysis.profit_pct,
-                        exit_reason=exit_reason.value
-                    )
-            except Exception as e:
-                logger.error(f"❌ Analytics record error: {e}")
-
-        # ── Signal Memory update ──────────────────────────────────────────
-        if self.signal_memory:
-            try:
-                self.signal_memory.update_outcome(
-                    symbol=symbol,
-                    exit_price=exit_price,
-                    profit_pct=exit_analysis.profit_pct,
-                    win=exit_analysis.profit_pct > 0,
-                    exit_reason=exit_reason.value,
+            if self.signal_memory:
+                group.create_task(
+                    self._update_memory(symbol, exit_analysis, exit_reason, exit_price)
                 )
-                logger.debug(f"📝 Memory updated: {symbol}")
-            except Exception as e:
-                logger.error(f"❌ Memory update error: {e}")
-
-        # ── Signal history DB result ──────────────────────────────────────
-        if self.signal_history_db:
-            try:
-                pos = self.exit_handler.active_positions.get(symbol)
-                if pos and pos.get("signal_id"):
-                    is_win = exit_analysis.profit_pct > 0
-                    from datetime import datetime
-                    result = SignalResult(
-                        signal_id=pos["signal_id"],
-                        symbol=symbol,
-                        actual_entry_price=pos["entry_price"],
-                        entry_time=pos.get("entry_time", datetime.now().isoformat()),
-                        exit_price=exit_price,
-                        exit_time=exit_time,
-                        exit_reason=exit_reason.value,
-                        profit_pct=exit_analysis.profit_pct,
-                        profit_usd=exit_analysis.profit_pct,
-                        days_held=exit_analysis.hold_duration_hours / 24,
-                        status=SignalStatus.CLOSED_WIN if is_win else SignalStatus.CLOSED_LOSS,
-                    )
-                    self.signal_history_db.record_signal_result(result)
-            except Exception as e:
-                logger.error(f"❌ signal_history result error: {e}")
+            if self.signal_history_db:
+                group.create_task(self._record_signal_result(
+                    symbol, pos, exit_analysis, exit_reason, exit_price, exit_time
+                ))
 
         # ── Close position ────────────────────────────────────────────────
         self.exit_handler.close_position(symbol, exit_analysis)
         self._exit_advised.discard(symbol)  # reset for next trade
+        self._entry_dt.pop(symbol, None)
         logger.info(f"✅ Position closed: {symbol}")
 
+    # ─── Exit side effects ────────────────────────────────────────────────
+
+    async def _send_sell_message(self, symbol: str, exit_analysis):
+        try:
+            msg = SellSignalMessageGenerator.generate_sell_message(
+                symbol=symbol, exit_analysis=exit_analysis
+            )
+            await self._send_telegram(msg, symbol)
+            logger.info(f"📤 SELL signal queued: {symbol}")
+        except Exception as e:
+            logger.error(f"❌ Sell message error: {e}")
+
+    async def _record_analytics(self, pos, exit_analysis, exit_reason, exit_time: str):
+        try:
+            if pos and pos.get("signal_id"):
+                record = (
+                    pos["signal_id"],
+                    "SUCCESS" if exit_analysis.profit_pct > 0 else "FAILURE",
+                    exit_analysis.profit_pct,
+                    exit_reason.value,
+                    exit_time,
+                )
+                if self._analytics_queue is not None:
+                    self._analytics_queue.put_nowait(record)
+                else:
+                    await asyncio.to_thread(self.analytics_db.record_performance_many, [record])
+        except Exception as e:
+            logger.error(f"❌ Analytics record error: {e}")
+
+    async def _update_memory(self, symbol: str, exit_analysis, exit_reason, exit_price: float):
+        try:
+            # sqlite sync-ია, connection ყოველ call-ზე ახალი — thread-ში უსაფრთხოა
+            await asyncio.to_thread(
+                self.signal_memory.update_outcome,
+                symbol=symbol,
+                exit_price=exit_price,
+                profit_pct=exit_analysis.profit_pct,
+                win=exit_analysis.profit_pct > 0,
+                exit_reason=exit_reason.value,
+            )
+            logger.debug("📝 Memory updated: %s", symbol)
+        except Exception as e:
+            logger.error(f"❌ Memory update error: {e}")
+
+    async def _record_signal_result(
+        self, symbol: str, pos, exit_analysis, exit_reason, exit_price: float, exit_time: str
+    ):
+        try:
+            if pos and pos.get("signal_id"):
+                is_win = exit_analysis.profit_pct > 0
+                result = SignalResult(
+                    signal_id=pos["signal_id"],
+                    symbol=symbol,
+                    actual_entry_price=pos["entry_price"],
+                    entry_time=pos.get("entry_time", datetime.now().isoformat()),
+                    exit_price=exit_price,
+                    exit_time=exit_time,
+                    exit_reason=exit_reason.value,
+                    profit_pct=exit_analysis.profit_pct,
+                    profit_usd=exit_analysis.profit_pct,
+                    days_held=exit_analysis.hold_duration_hours / 24,
+                    status=SignalStatus.CLOSED_WIN if is_win else SignalStatus.CLOSED_LOSS,
+                )
+                await asyncio.to_thread(self.signal_history_db.record_signal_result, result)
+        except Exception as e:
+            logger.error(f"❌ signal_history result error: {e}")
+
     # ═══════════════════════════════════════════════════════════════════════
     # HELPERS
     # ═══════════════════════════════════════════════════════════════════════
 
+    def _entry_datetime(self, symbol: str, entry_time: str) -> datetime:
+        cached = self._entry_dt.get(symbol)
+        if cached is not None and cached[0] == entry_time:
+            return cached[1]
+        entry_dt = datetime.fromisoformat(entry_time)
+        self._entry_dt[symbol] = (entry_time, entry_dt)
+        return entry_dt
+
     def _get_tier(self, symbol: str) -> str:
-        from config import get_tier
         return get_tier(symbol)
 
     def get_position_status_report(self) -> str:
@@ -358,23 +710,22 @@ class PositionMonitor:
         if not active:
             return "📭 არ არის აქტიური positions"
 
-        msg = f"📊 აქტიური Positions: {len(active)}\n\n"
+        parts = [f"📊 აქტიური Positions: {len(active)}\n\n"]
         for symbol, pos in active.items():
-            entry  = pos["entry_price"]
-            target = pos["target_price"]
-            stop   = pos["stop_loss_price"]
-            msg += (
+            parts.append(
                 f"{symbol}\n"
-                f"├─ Entry:  ${entry:.4f}\n"
-                f"├─ Target: ${target:.4f}\n"
-                f"└─ Stop:   ${stop:.4f}\n\n"
+                f"├─ Entry:  ${pos['entry_price']:.4f}\n"
+                f"├─ Target: ${pos['target_price']:.4f}\n"
+                f"└─ Stop:   ${pos['stop_loss_price']:.4f}\n\n"
             )
-        return msg
+        return "".join(parts)
 
     def get_monitoring_statistics(self) -> Dict:
         return {
             "is_monitoring":    self.is_monitoring,
             "scan_interval":    self.scan_interval,
+            "loop_lag_ms":      round(self.loop_lag_ms, 1),
+            "max_loop_lag_ms":  round(self.max_loop_lag_ms, 1),
             "active_positions": len(self.exit_handler.active_positions),
             "closed_positions": len(self.exit_handler.exit_history),
             "exit_stats":       self.exit_handler.get_exit_statistics(),
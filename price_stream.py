@@ -0,0 +1,143 @@
+"""
+Price Stream - Binance WebSocket ticker feed
+ერთი WS კავშირი ყველა ღია crypto position-ისთვის (combined miniTicker stream).
+tick → asyncio.Queue → PositionMonitor-ის consumer (update_price + exit check).
+Binance mapping არ აქვს (მაგ. აქციები) → symbol რჩება 60s poll-ზე.
+"""
+
+import asyncio
+import random
+import logging
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import aiohttp
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+BINANCE_WS_URL = "wss://stream.binance.com:9443/ws"
+
+
+class PriceStream:
+    """
+    subscribe/unsubscribe set_symbols()-ით; კავშირის გაწყვეტისას reconnect
+    jittered backoff-ით და მიმდინარე set-ის ხელახალი subscribe.
+    """
+
+    MAX_BACKOFF = 30.0
+    QUEUE_SIZE  = 10_000
+
+    def __init__(self, to_stream_symbol: Callable[[str], Optional[str]]):
+        # our symbol → binance symbol (მაგ. "BTC/USD" → "BTCUSDT"), None → stream არ არის
+        self._to_stream = to_stream_symbol
+        self._by_stream: Dict[str, str] = {}    # "BTCUSDT" → "BTC/USD"
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self._msg_id = 0
+
+    @staticmethod
+    def _param(stream_symbol: str) -> str:
+        return f"{stream_symbol.lower()}@miniTicker"
+
+    # ─── Lifecycle ────────────────────────────────────────────────────────
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ─── Subscriptions ────────────────────────────────────────────────────
+
+    async def set_symbols(self, symbols: Iterable[str]):
+        """ღია position-ების set — ახალს subscribe, დახურულს unsubscribe"""
+        wanted: Dict[str, str] = {}
+        for s in symbols:
+            bs = self._to_stream(s)
+            if bs:
+                wanted[bs] = s
+        added   = wanted.keys() - self._by_stream.keys()
+        removed = self._by_stream.keys() - wanted.keys()
+        self._by_stream = wanted
+        if removed:
+            await self._send("UNSUBSCRIBE", removed)
+        if added:
+            await self._send("SUBSCRIBE", added)
+
+    async def _send(self, method: str, stream_symbols: Iterable[str]):
+        ws = self._ws
+        if ws is None or ws.closed:
+            return  # reconnect-ისას _run თვითონ subscribe-ს მთელ set-ს
+        self._msg_id += 1
+        try:
+            await ws.send_json({
+                "method": method,
+                "params": [self._param(bs) for bs in stream_symbols],
+                "id": self._msg_id,
+            })
+        except Exception as e:
+            logger.debug("⚠️ PriceStream %s failed: %s", method, e)
+
+    # ─── Reader ───────────────────────────────────────────────────────────
+
+    async def _run(self):
+        attempt = 0
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.ws_connect(BINANCE_WS_URL, heartbeat=30) as ws:
+                        self._ws = ws
+                        attempt = 0
+                        logger.info("📡 PriceStream connected (%d symbols)", len(self._by_stream))
+                        if self._by_stream:
+                            await self._send("SUBSCRIBE", list(self._by_stream))
+                        async for msg in ws:
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                tick = self._parse(msg.data)
+                                if tick is not None:
+                                    self._put(tick)
+                            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                break
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning("⚠️ PriceStream error: %s", e)
+                finally:
+                    self._ws = None
+                delay = random.uniform(0, min(2 ** attempt, self.MAX_BACKOFF))
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    def _parse(self, data: str) -> Optional[Tuple[str, float]]:
+        try:
+            payload = _json_loads(data)
+            if payload.get("e") != "24hrMiniTicker":
+                return None   # subscribe ack-ები და სხვა event-ები
+            symbol = self._by_stream.get(payload["s"])
+            if symbol is None:
+                return None   # unsubscribe-მდე მოსული tick
+            return symbol, float(payload["c"])
+        except Exception:
+            return None
+
+    def _put(self, tick: Tuple[str, float]):
+        try:
+            self.queue.put_nowait(tick)
+        except asyncio.QueueFull:
+            # consumer ჩამორჩა — უძველესი tick იკარგება, ახალი ფასი უფრო მნიშვნელოვანია
+            self.queue.get_nowait()
+            self.queue.put_nowait(tick)
\ No newline at end of file
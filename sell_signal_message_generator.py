@@ -11,149 +11,147 @@ CHANGES v2.0:
   - max_profit section: ყიდვა-გაყიდვის შუალედის პიკი ყოველთვის ჩანს
 """
 
+import itertools
+import math
+from typing import Iterable, List
+
 from exit_signals_handler import ExitAnalysis, ExitReason
 
+# ════════════════════════════════════════════════════════════════════════════
+# EXIT REASON LABELS — import-ისას ერთხელ, არა ყოველ message-ზე
+# ════════════════════════════════════════════════════════════════════════════
+_EXIT_EMOJI = {
+    ExitReason.TARGET_HIT:    "🎯",
+    ExitReason.STOP_LOSS:     "🛑",
+    ExitReason.TIMEOUT:       "⏰",
+    ExitReason.MANUAL:        "✋",
+    ExitReason.PARTIAL_EXIT:  "📊",
+    ExitReason.TRAILING_STOP: "🔒",
+}
+_EXIT_REASON_TEXT = {
+    ExitReason.TARGET_HIT:    "სამიზნე მიღწეულია",
+    ExitReason.STOP_LOSS:     "ზარალი ჩაჩეკა",
+    ExitReason.TIMEOUT:       "დრო გასული",
+    ExitReason.MANUAL:        "ხელით დახურვა",
+    ExitReason.PARTIAL_EXIT:  "ნაწილობრივი გასვლა",
+    ExitReason.TRAILING_STOP: "Trailing Stop",
+}
+_SEP = "═" * 50
+_BRIEF_EMOJI = {ExitReason.TARGET_HIT: "🎯"}   # სხვა ყველა → 🛑
+_WL_EMOJI = ("❌", "✅")                        # [profit > 0]
+
 
 class SellSignalMessageGenerator:
 
+    # სრული message-ის სექციები რიგით — include-ით caller-ს მხოლოდ საჭიროს აწყობა შეუძლია
+    SECTIONS = ("header", "price", "pnl", "max_profit", "expectation", "summary")
+
     @staticmethod
     def generate_sell_message(
         symbol: str,
         exit_analysis: ExitAnalysis,
-        market_context: str = ""
+        market_context: str = "",
+        include: Iterable[str] = SECTIONS,
     ) -> str:
         """
         Sell signal — ორი სცენარი:
           A) profit_pct > 0  →  გრანდიოზული WIN ბლოკი
           B) profit_pct <= 0 →  ზარალი, მაგრამ max_profit ჩანს თუ > 0
+        include — მხოლოდ ჩამოთვლილი სექციები იწყობა (დანარჩენი საერთოდ არ ითვლება)
         """
 
-        is_win = exit_analysis.profit_pct > 0
-
-        # ════════════════════════════════════════════════════════════════════
-        # EXIT REASON LABELS
-        # ════════════════════════════════════════════════════════════════════
-        exit_reason_emoji = {
-            ExitReason.TARGET_HIT:    "🎯",
-            ExitReason.STOP_LOSS:     "🛑",
-            ExitReason.TIMEOUT:       "⏰",
-            ExitReason.MANUAL:        "✋",
-            ExitReason.PARTIAL_EXIT:  "📊",
-            ExitReason.TRAILING_STOP: "🔒",
-        }
-        exit_reason_text = {
-            ExitReason.TARGET_HIT:    "სამიზნე მიღწეულია",
-            ExitReason.STOP_LOSS:     "ზარალი ჩაჩეკა",
-            ExitReason.TIMEOUT:       "დრო გასული",
-            ExitReason.MANUAL:        "ხელით დახურვა",
-            ExitReason.PARTIAL_EXIT:  "ნაწილობრივი გასვლა",
-            ExitReason.TRAILING_STOP: "Trailing Stop",
-        }
-        emoji       = exit_reason_emoji.get(exit_analysis.exit_reason, "📊")
-        reason_text = exit_reason_text.get(exit_analysis.exit_reason, "გაყიდვა")
+        ea          = exit_analysis
+        is_win      = ea.profit_pct > 0
+        emoji       = _EXIT_EMOJI.get(ea.exit_reason, "📊")
+        reason_text = _EXIT_REASON_TEXT.get(ea.exit_reason, "გაყიდვა")
+        # რამდენიმე სექციაში მეორდება → ერთხელ ფორმატდება
+        label = f"{emoji} **{reason_text.upper()}** | {symbol}"
+        pct   = f"{ea.profit_pct:+.2f}%"
 
-        if is_win:
-            return SellSignalMessageGenerator._win_message(
-                symbol, exit_analysis, emoji, reason_text
-            )
-        else:
-            return SellSignalMessageGenerator._loss_message(
-                symbol, exit_analysis, emoji, reason_text
-            )
+        return "".join(itertools.chain.from_iterable(
+            _SECTION_FNS[name](ea, is_win, label, pct) for name in include
+        ))
 
     # ════════════════════════════════════════════════════════════════════════
-    # WIN MESSAGE — გრანდიოზული
+    # SECTIONS — WIN გრანდიოზული, LOSS-ში max_profit ყოველთვის ჩანს
     # ════════════════════════════════════════════════════════════════════════
 
+    # თითო სექცია ერთი template-ია (ერთი f-string / concat) — ხაზ-ხაზ append-ის ნაცვლად
+
     @staticmethod
-    def _win_message(symbol, ea: ExitAnalysis, emoji: str, reason_text: str) -> str:
-        msg = f"🎉🟢 **დაკეტებული მოგებით: {ea.profit_pct:+.2f}%** 🟢🎉\n"
-        msg += f"💡 შემდეგი ტრეიდი უფრო ზუსტი იქნება 🚀\n"
-        msg += "═" * 50 + "\n\n"
-
-        # HEADER
-        msg += f"{emoji} **{reason_text.upper()}** | {symbol}\n\n"
-
-        # ── ფასი ──────────────────────────────────────────────
-        msg += "**💰 ფასის მოძრაობა:**\n"
-        msg += f"🔵 შესვლა:  ${ea.entry_price:.4f}\n"
-        msg += f"🟢 გასვლა:  ${ea.exit_price:.4f}\n\n"
-
-        # ── მოგება (მთავარი — დიდი ბლოკი) ───────────────────
-        msg += "**📈 მოგება:**\n"
-        msg += f"📊 პროცენტი:  **{ea.profit_pct:+.2f}%**\n"
-        msg += f"💵 $100 → **${ea.final_value:.2f}**  (${ea.simulated_profit_usd:+.2f})\n\n"
-
-        # ── მაქს მოგება ──────────────────────────────────────
-        msg += "**📈 მაქსიმალური მოგება ყიდვა→გაყიდვა შუალედში:**\n"
-        msg += f"🔝 {ea.max_profit_pct_during_hold:+.2f}%\n"
-
-        left_on_table = ea.max_profit_pct_during_hold - ea.profit_pct
-        if left_on_table > 0.5:
-            msg += f"⚠️ სხვაობა:   {left_on_table:.2f}% (პიკზე ადრე გავედი)\n"
-        msg += "\n"
-
-        # ── ✅ სიგნალი სწორი იყო (ბოტმა sell გამოიტანა მოგებით) ──
-        msg += "**🎯 პროგნოზი vs რეალობა:**\n"
-        msg += f"📌 მოსალოდნელი:  {ea.expected_profit_min:.1f}% - {ea.expected_profit_max:.1f}%\n"
-        msg += f"📊 რეალური:     {ea.profit_pct:.2f}%\n"
-        # ✅ ბოტი გამოიტანა sell მოგებით → სიგნალი ყოველთვის სწორი
-        msg += "✅ **სიგნალი სწორი იყო!**\n\n"
-
-        # ── ხანგრძლივობა + ნდობა ─────────────────────────────
-        msg += f"⏱️ ვაჭრობის დრო: {ea.hold_duration_human}\n"
-        msg += f"🧠 ნდობა: {ea.signal_confidence:.0f}%\n"
-
-        return msg
+    def _section_header(ea: ExitAnalysis, is_win: bool, label: str, pct: str) -> List[str]:
+        if is_win:
+            return [
+                f"🎉🟢 **დაკეტებული მოგებით: {pct}** 🟢🎉\n"
+                f"💡 შემდეგი ტრეიდი უფრო ზუსტი იქნება 🚀\n{_SEP}\n\n{label}\n\n"
+            ]
+        return [f"{_SEP}\n{label}\n{_SEP}\n\n"]
 
-    # ════════════════════════════════════════════════════════════════════════
-    # LOSS MESSAGE — ზარალი, მაგრამ max_profit ყოველთვის ჩანს
-    # ════════════════════════════════════════════════════════════════════════
+    @staticmethod
+    def _section_price(ea: ExitAnalysis, is_win: bool, label: str, pct: str) -> List[str]:
+        return [
+            f"**💰 ფასის მოძრაობა:**\n"
+            f"🔵 შესვლა:  ${ea.entry_price:.4f}\n"
+            f"{'🟢' if is_win else '🔴'} გასვლა:  ${ea.exit_price:.4f}\n\n"
+        ]
 
     @staticmethod
-    def _loss_message(symbol, ea: ExitAnalysis, emoji: str, reason_text: str) -> str:
-        msg = "═" * 50 + "\n"
-        msg += f"{emoji} **{reason_text.upper()}** | {symbol}\n"
-        msg += "═" * 50 + "\n\n"
-
-        # ── ფასი ──────────────────────────────────────────────
-        msg += "**💰 ფასის მოძრაობა:**\n"
-        msg += f"🔵 შესვლა:  ${ea.entry_price:.4f}\n"
-        msg += f"🔴 გასვლა:  ${ea.exit_price:.4f}\n\n"
-
-        # ── ზარალი ───────────────────────────────────────────
-        msg += "**📉 ზარალი:**\n"
-        msg += f"📊 პროცენტი:  {ea.profit_pct:+.2f}%\n"
-        msg += f"💵 $100 → ${ea.final_value:.2f}  (${ea.simulated_profit_usd:+.2f})\n\n"
-
-        # ── მაქს მოგება hold-ში ── (ყოველთვის ჩანს!)
-        msg += "**📈 მაქსიმალური მოგება ყიდვა→გაყიდვა შუალედში:**\n"
-        msg += f"🔝 {ea.max_profit_pct_during_hold:+.2f}%\n"
-
-        # თუ hold-ში მოგება ჰქონდა მაგრამ დახურდა ზარალით
-        if ea.max_profit_pct_during_hold > 1.0:
-            msg += f"💡 სიგნალის პერიოდში **+{ea.max_profit_pct_during_hold:.2f}%** შეიძლებოდა\n"
-        msg += "\n"
-
-        # ── პროგნოზი vs რეალობა ───────────────────────────────
-        msg += "**🎯 პროგნოზი vs რეალობა:**\n"
-        msg += f"📌 მოსალოდნელი:  {ea.expected_profit_min:.1f}% - {ea.expected_profit_max:.1f}%\n"
-        msg += f"📊 რეალური:     {ea.profit_pct:.2f}%\n"
-        # ✅ ზარალის დროს ვწერთ "ნაწილობრივ" თუ max_profit ჰქონდა, სხვა შემთხვევაში — ❌
-        if ea.max_profit_pct_during_hold >= ea.expected_profit_min:
-            msg += "🟡 **ნაწილობრივ სწორი (სიგნალი მომგებიანი მომენტი ჰქონდა)**\n\n"
-        else:
-            msg += "❌ **პროგნოზი ვერ სრულდება**\n\n"
+    def _section_pnl(ea: ExitAnalysis, is_win: bool, label: str, pct: str) -> List[str]:
+        if is_win:
+            return [
+                f"**📈 მოგება:**\n"
+                f"📊 პროცენტი:  **{pct}**\n"
+                f"💵 $100 → **${ea.final_value:.2f}**  (${ea.simulated_profit_usd:+.2f})\n\n"
+            ]
+        return [
+            f"**📉 ზარალი:**\n"
+            f"📊 პროცენტი:  {pct}\n"
+            f"💵 $100 → ${ea.final_value:.2f}  (${ea.simulated_profit_usd:+.2f})\n\n"
+        ]
 
-        # ── ხანგრძლივობა + ნდობა ─────────────────────────────
-        msg += f"⏱️ ვაჭრობის დრო: {ea.hold_duration_human}\n"
-        msg += f"🧠 ნდობა: {ea.signal_confidence:.0f}%\n\n"
+    @staticmethod
+    def _section_max_profit(ea: ExitAnalysis, is_win: bool, label: str, pct: str) -> List[str]:
+        max_pct = ea.max_profit_pct_during_hold
+        note = ""
+        if is_win:
+            left_on_table = max_pct - ea.profit_pct
+            if left_on_table > 0.5:
+                note = f"⚠️ სხვაობა:   {left_on_table:.2f}% (პიკზე ადრე გავედი)\n"
+        elif max_pct > 1.0:
+            # hold-ში მოგება ჰქონდა მაგრამ დახურდა ზარალით
+            note = f"💡 სიგნალის პერიოდში **+{max_pct:.2f}%** შეიძლებოდა\n"
+        return [f"**📈 მაქსიმალური მოგება ყიდვა→გაყიდვა შუალედში:**\n🔝 {max_pct:+.2f}%\n{note}\n"]
 
-        msg += "═" * 50 + "\n"
-        msg += f"❌ **დაკეტებული ზარალით: {ea.profit_pct:+.2f}%**\n"
-        msg += "💡 შემდეგი ტრეიდი უფრო ზუსტი იქნება 🚀\n"
+    @staticmethod
+    def _section_expectation(ea: ExitAnalysis, is_win: bool, label: str, pct: str) -> List[str]:
+        if is_win:
+            # ✅ ბოტი გამოიტანა sell მოგებით → სიგნალი ყოველთვის სწორი
+            verdict = "✅ **სიგნალი სწორი იყო!**"
+        elif ea.max_profit_pct_during_hold >= ea.expected_profit_min:
+            # ზარალის დროს "ნაწილობრივ" თუ max_profit ჰქონდა, სხვა შემთხვევაში — ❌
+            verdict = "🟡 **ნაწილობრივ სწორი (სიგნალი მომგებიანი მომენტი ჰქონდა)**"
+        else:
+            verdict = "❌ **პროგნოზი ვერ სრულდება**"
+        return [
+            f"**🎯 პროგნოზი vs რეალობა:**\n"
+            f"📌 მოსალოდნელი:  {ea.expected_profit_min:.1f}% - {ea.expected_profit_max:.1f}%\n"
+            f"📊 რეალური:     {ea.profit_pct:.2f}%\n"
+            f"{verdict}\n\n"
+        ]
 
-        return msg
+    @staticmethod
+    def _section_summary(ea: ExitAnalysis, is_win: bool, label: str, pct: str) -> List[str]:
+        summary = (
+            f"⏱️ ვაჭრობის დრო: {ea.hold_duration_human}\n"
+            f"🧠 ნდობა: {ea.signal_confidence:.0f}%\n"
+        )
+        if is_win:
+            return [summary]
+        return [
+            f"{summary}\n{_SEP}\n"
+            f"❌ **დაკეტებული ზარალით: {pct}**\n"
+            f"💡 შემდეგი ტრეიდი უფრო ზუსტი იქნება 🚀\n"
+        ]
 
     # ════════════════════════════════════════════════════════════════════════
     # BRIEF (unchanged)
@@ -161,37 +159,40 @@ class SellSignalMessageGenerator:
 
     @staticmethod
     def generate_brief_sell_message(symbol: str, exit_analysis: ExitAnalysis) -> str:
-        emoji = "🎯" if exit_analysis.exit_reason == ExitReason.TARGET_HIT else "🛑"
-        msg = f"{emoji} **გაყიდვა** | {symbol}\n\n"
-        msg += f"Entry:  ${exit_analysis.entry_price:.4f}\n"
-        msg += f"Exit:   ${exit_analysis.exit_price:.4f}\n"
-        msg += f"P&L:    {exit_analysis.profit_pct:+.2f}% (${exit_analysis.profit_usd:+.2f})\n\n"
-        msg += f"100$:   ${exit_analysis.simulated_profit_usd:+.2f} "
-        msg += f"({exit_analysis.simulated_profit_pct:+.2f}%)\n"
-        msg += f"Hold:   {exit_analysis.hold_duration_human}\n"
-        return msg
+        ea = exit_analysis
+        emoji = _BRIEF_EMOJI.get(ea.exit_reason, "🛑")
+        return (
+            f"{emoji} **გაყიდვა** | {symbol}\n\n"
+            f"Entry:  ${ea.entry_price:.4f}\n"
+            f"Exit:   ${ea.exit_price:.4f}\n"
+            f"P&L:    {ea.profit_pct:+.2f}% (${ea.profit_usd:+.2f})\n\n"
+            f"100$:   ${ea.simulated_profit_usd:+.2f} "
+            f"({ea.simulated_profit_pct:+.2f}%)\n"
+            f"Hold:   {ea.hold_duration_human}\n"
+        )
 
     @staticmethod
     def generate_position_summary(exit_history: list) -> str:
         if not exit_history:
             return "📭 **არ არის დახურული positions**"
 
-        msg = "📊 **TRADES SUMMARY:**\n\n"
-        total_profit = 0
-        wins = 0
-        losses = 0
-
-        for trade in exit_history[-10:]:
-            profit_pct = trade['profit_pct']
-            total_profit += profit_pct
-            if profit_pct > 0:
-                wins += 1
-                emoji = "✅"
-            else:
-                losses += 1
-                emoji = "❌"
-            msg += f"{emoji} {trade['symbol']} - {profit_pct:+.2f}%\n"
-
-        msg += f"\n📈 **სულ:** {wins}/{len(exit_history[-10:])} win rate\n"
-        msg += f"💰 **საშუალო:** {total_profit / len(exit_history[-10:]):+.2f}%\n"
-        return msg
\ No newline at end of file
+        tail    = exit_history[-10:]
+        n       = len(tail)
+        profits = [trade['profit_pct'] for trade in tail]
+        wins    = sum(1 for p in profits if p > 0)
+        total_profit = math.fsum(profits)
+
+        parts = ["📊 **TRADES SUMMARY:**\n\n"]
+        parts.extend(
+            f"{_WL_EMOJI[p > 0]} {trade['symbol']} - {p:+.2f}%\n"
+            for trade, p in zip(tail, profits)
+        )
+        parts.append(f"\n📈 **სულ:** {wins}/{n} win rate\n")
+        parts.append(f"💰 **საშუალო:** {total_profit / n:+.2f}%\n")
+        return "".join(parts)
+
+
+_SECTION_FNS = {
+    name: getattr(SellSignalMessageGenerator, f"_section_{name}")
+    for name in SellSignalMessageGenerator.SECTIONS
+}
\ No newline at end of file
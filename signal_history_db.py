@@ -7,10 +7,13 @@ SIGNAL HISTORY DATABASE - v1.0 FIXED
 import sqlite3
 import json
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -19,17 +22,30 @@ logger = logging.getLogger(__name__)
 # DATA MODELS
 # ═══════════════════════════════════════════════════════════════════════════
 
-class SignalStatus(Enum):
-    """სიგნალის სტატუსი"""
-    SENT = "sent"              # ტელეგრამზე გაიგზავნა
-    WAITING_ENTRY = "waiting"  # ელოდება შესვლას
-    ENTRY_FILLED = "entry"     # user შევიდა
-    CLOSED_WIN = "win"          # დაკეტო მოგებით
-    CLOSED_LOSS = "loss"        # დაკეტო ზარალით
-    CLOSED_TIMEOUT = "timeout"  # დრო გასული
-    CANCELLED = "cancelled"     # გაუქმა
-
-@dataclass
+class SignalStatus(IntEnum):
+    """სიგნალის სტატუსი — DB-ში INTEGER (ნაკლები row/index ზომა, int compare)"""
+    SENT = 0            # ტელეგრამზე გაიგზავნა
+    WAITING_ENTRY = 1   # ელოდება შესვლას
+    ENTRY_FILLED = 2    # user შევიდა
+    CLOSED_WIN = 3      # დაკეტო მოგებით
+    CLOSED_LOSS = 4     # დაკეტო ზარალით
+    CLOSED_TIMEOUT = 5  # დრო გასული
+    CANCELLED = 6       # გაუქმა
+
+
+# public dict-ებში status ისევ ძველი string-ია (caller-ები 'win'/'loss'-ს ადარებენ)
+_STATUS_LABEL = {
+    SignalStatus.SENT:           "sent",
+    SignalStatus.WAITING_ENTRY:  "waiting",
+    SignalStatus.ENTRY_FILLED:   "entry",
+    SignalStatus.CLOSED_WIN:     "win",
+    SignalStatus.CLOSED_LOSS:    "loss",
+    SignalStatus.CLOSED_TIMEOUT: "timeout",
+    SignalStatus.CANCELLED:      "cancelled",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SentSignal:
     """გაგზავნილი სიგნალი"""
     # Signal info
@@ -54,7 +70,7 @@ class SentSignal:
     tier: str = "BLUE_CHIP"
     message_text: str = ""  # რას დაწერა telegram-ში
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignalResult:
     """სიგნალის შედეგი"""
     # Required fields (no defaults)
@@ -76,6 +92,116 @@ class SignalResult:
 # DATABASE
 # ═══════════════════════════════════════════════════════════════════════════
 
+_SQL_CREATE_RESULTS = """
+    CREATE TABLE IF NOT EXISTS signal_results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        signal_id INTEGER UNIQUE NOT NULL,
+
+        -- Entry
+        actual_entry_price REAL,
+        entry_time TEXT,
+
+        -- Exit
+        exit_price REAL,
+        exit_time TEXT,
+        exit_reason TEXT,
+
+        -- P&L
+        profit_pct REAL,
+        profit_usd REAL,
+
+        -- Duration
+        days_held REAL,
+
+        -- Status
+        status INTEGER NOT NULL,
+
+        -- Notes
+        notes TEXT,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+
+        FOREIGN KEY (signal_id) REFERENCES sent_signals(id)
+    )
+"""
+
+# ძველი ფაილის TEXT status → INTEGER
+_SQL_STATUS_TO_INT = (
+    "CASE status "
+    + " ".join(f"WHEN '{label}' THEN {int(st)}" for st, label in _STATUS_LABEL.items())
+    + " ELSE status END"
+)
+
+# write SQL — ერთი და იგივე string object ყოველ call-ზე → connection-ის
+# statement cache-ში ყოველთვის hit (ხელახალი parse/prepare აღარ)
+_SQL_INSERT_SIGNAL = """
+    INSERT INTO sent_signals (
+        symbol, strategy, entry_price, target_price, stop_loss_price,
+        sent_time, confidence_score, ai_approved,
+        expected_profit_min, expected_profit_max,
+        tier, message_text
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_EMPTY_RESULT = """
+    INSERT INTO signal_results (signal_id, status)
+    VALUES (?, ?)
+"""
+
+_SQL_UPDATE_RESULT = """
+    UPDATE signal_results
+    SET
+        actual_entry_price = ?,
+        entry_time = ?,
+        exit_price = ?,
+        exit_time = ?,
+        exit_reason = ?,
+        profit_pct = ?,
+        profit_usd = ?,
+        days_held = ?,
+        status = ?
+    WHERE signal_id = ?
+"""
+
+_SQL_UPDATE_NOTE = """
+    UPDATE signal_results
+    SET notes = ?
+    WHERE signal_id = ?
+"""
+
+
+def _signal_row(signal: SentSignal) -> Tuple:
+    """SentSignal → INSERT params (dataclasses.astuple deepcopy-ს აკეთებს — აქ არ გვჭირდება)"""
+    return (
+        signal.symbol,
+        signal.strategy,
+        signal.entry_price,
+        signal.target_price,
+        signal.stop_loss_price,
+        signal.sent_time,
+        signal.confidence_score,
+        1 if signal.ai_approved else 0,
+        signal.expected_profit_min,
+        signal.expected_profit_max,
+        signal.tier,
+        signal.message_text
+    )
+
+
+def _result_row(result: SignalResult) -> Tuple:
+    return (
+        result.actual_entry_price,
+        result.entry_time,
+        result.exit_price,
+        result.exit_time,
+        result.exit_reason,
+        result.profit_pct,
+        result.profit_usd,
+        result.days_held,
+        result.status.value,
+        result.signal_id
+    )
+
+
 class SignalHistoryDB:
     """
     SIGNAL HISTORY DATABASE
@@ -83,14 +209,58 @@ class SignalHistoryDB:
     სიგნალის ყველა ისტორია რო გაიგზავნა
     """
 
+    STATS_TTL = 2.0   # seconds
+
     def __init__(self, db_path: str = "signal_history.db"):
         self.db_path = db_path
+        # ერთი connection მთელი lifetime-ისთვის (ყოველ call-ზე open/close აღარ);
+        # exit path to_thread-იდანაც წერს → check_same_thread=False + lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        self._lock = threading.Lock()
+        # get_overall_stats TTL cache — dashboard polling; საკუთარი write აუქმებს.
+        # სხვა instance-ის (იგივე ფაილი) write მაქსიმუმ STATS_TTL-ით გვიან ჩანს
+        self._stats_cache: Tuple[float, Optional[Dict]] = (0.0, None)
+        # ცნობილი უდიდესი sent_signals.id — id AUTOINCREMENT-ია, ამიტომ მასზე მეტი
+        # id query-ის გარეშე უარდება (სხვა instance-ის ახალი id → refresh MAX(id)-ით)
+        self._max_known_id = 0
+        self._configure_connection()
         self._init_database()
+        with self._connect() as conn:
+            self._refresh_max_id(conn)
+
+    def _configure_connection(self):
+        """
+        WAL — commit აღარ fsync-ავს მთელ journal-ს, reader-ები writer-ს არ ბლოკავს;
+        synchronous=NORMAL WAL-ში crash-safe-ია (მხოლოდ ბოლო commit შეიძლება დაიკარგოს)
+        """
+        conn = self._conn
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if mode.lower() != "wal":
+            logger.warning(f"⚠️ Signal History DB: WAL unavailable (journal_mode={mode})")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")   # 256MB
+        conn.execute("PRAGMA cache_size=-20000")     # ~20MB
+
+    @contextmanager
+    def _connect(self):
+        """sqlite3.connect()-ის `with`-ის სემანტიკა: success → commit, error → rollback"""
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
 
     def _init_database(self):
         """Database initialization"""
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # ════════════════════════════════════════════════════════════════
             # TABLE 1: SENT_SIGNALS - ყველა გაგზავნილი სიგნალი
             # ════════════════════════════════════════════════════════════════
@@ -130,37 +300,8 @@ class SignalHistoryDB:
             # TABLE 2: SIGNAL_RESULTS - სიგნალის შედეგი
             # ════════════════════════════════════════════════════════════════
 
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS signal_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    signal_id INTEGER UNIQUE NOT NULL,
-
-                    -- Entry
-                    actual_entry_price REAL,
-                    entry_time TEXT,
-
-                    -- Exit
-                    exit_price REAL,
-                    exit_time TEXT,
-                    exit_reason TEXT,
-
-                    -- P&L
-                    profit_pct REAL,
-                    profit_usd REAL,
-
-                    -- Duration
-                    days_held REAL,
-
-                    -- Status
-                    status TEXT NOT NULL,
-
-                    -- Notes
-                    notes TEXT,
-                    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
-
-                    FOREIGN KEY (signal_id) REFERENCES sent_signals(id)
-                )
-            """)
+            conn.execute(_SQL_CREATE_RESULTS)
+            self._migrate_status_column(conn)
 
             # ════════════════════════════════════════════════════════════════
             # INDEXES
@@ -170,85 +311,104 @@ class SignalHistoryDB:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_strategy ON sent_signals(strategy)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON signal_results(status)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_sent_time ON sent_signals(sent_time)")
+            # covering — symbol/strategy aggregate-ების join + status/profit/days index-იდან,
+            # overall stats (status != sent) profit-ით table-ს აღარ კითხულობს
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_signal_status "
+                "ON signal_results(signal_id, status, profit_pct, days_held)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_results_status_profit "
+                "ON signal_results(status, profit_pct)"
+            )
 
             conn.commit()
+            conn.execute("ANALYZE")   # planner-ს index-ების სტატისტიკა
             logger.info("✅ Signal History DB initialized")
 
+    @staticmethod
+    def _migrate_status_column(conn: sqlite3.Connection):
+        """
+        ძველი ფაილი: status TEXT → INTEGER. TEXT affinity-ის column int-ს ისევ
+        text-ად შეინახავდა, ამიტომ UPDATE არ კმარა — table rebuild (ერთხელ).
+        DDL sqlite3-ის implicit transaction-ის გარეშე თავისით commit-დება →
+        მთელი rebuild ცხადი BEGIN IMMEDIATE … COMMIT-ით, შეცდომაზე ROLLBACK
+        (სხვაგვარად ნახევრად გადატანილი table შემდეგ start-ზე აღარ მიგრირდება)
+        """
+        if conn.in_transaction:
+            conn.commit()
+        # write lock check-მდე — ორი instance ერთდროულად ვერ მიგრირებს
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(signal_results)")}
+            if columns.get("status", "").upper() != "TEXT":
+                conn.execute("COMMIT")
+                return
+
+            conn.execute("ALTER TABLE signal_results RENAME TO signal_results_old")
+            conn.execute(_SQL_CREATE_RESULTS)
+            cols = ", ".join(c for c in columns if c != "status")
+            conn.execute(
+                f"INSERT INTO signal_results ({cols}, status) "
+                f"SELECT {cols}, {_SQL_STATUS_TO_INT} FROM signal_results_old"
+            )
+            conn.execute("DROP TABLE signal_results_old")   # ძველი index-ებიც მასთან ერთად
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info("✅ signal_results.status migrated to INTEGER")
+
     # ═══════════════════════════════════════════════════════════════════════
     # WRITE METHODS
     # ═══════════════════════════════════════════════════════════════════════
 
     def record_sent_signal(self, signal: SentSignal) -> int:
         """ნოვი სიგნალი რო გაიგზავნა"""
+        return self.record_sent_signals([signal])[0]
+
+    def record_sent_signals(self, signals: List[SentSignal]) -> List[int]:
+        """
+        რამდენიმე სიგნალი ერთ transaction-ში (ერთი commit მთელ batch-ზე).
+        sent_signals INSERT თითოეულზე — id (lastrowid) caller-ს უბრუნდება;
+        ცარიელი result row-ები ერთი executemany-ით.
+        """
+        if not signals:
+            return []
+
+        with self._connect() as conn:
+            signal_ids = []
+            for signal in signals:
+                cursor = conn.execute(_SQL_INSERT_SIGNAL, _signal_row(signal))
+                signal_ids.append(cursor.lastrowid)
+
+            # Create empty result rows
+            conn.executemany(
+                _SQL_INSERT_EMPTY_RESULT,
+                [(signal_id, SignalStatus.SENT.value) for signal_id in signal_ids]
+            )
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO sent_signals (
-                    symbol, strategy, entry_price, target_price, stop_loss_price,
-                    sent_time, confidence_score, ai_approved,
-                    expected_profit_min, expected_profit_max,
-                    tier, message_text
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                signal.symbol,
-                signal.strategy,
-                signal.entry_price,
-                signal.target_price,
-                signal.stop_loss_price,
-                signal.sent_time,
-                signal.confidence_score,
-                1 if signal.ai_approved else 0,
-                signal.expected_profit_min,
-                signal.expected_profit_max,
-                signal.tier,
-                signal.message_text
-            ))
-
-            signal_id = cursor.lastrowid
-
-            # Create empty result row
-            conn.execute("""
-                INSERT INTO signal_results (signal_id, status)
-                VALUES (?, ?)
-            """, (signal_id, SignalStatus.SENT.value))
-
-            conn.commit()
-
+        # commit-ის შემდეგ — rollback-ზე max არ იზრდება
+        self._max_known_id = max(self._max_known_id, signal_ids[-1])
+        self._stats_cache = (0.0, None)
+        for signal, signal_id in zip(signals, signal_ids):
             logger.info(f"📝 Signal recorded: {signal.symbol} (ID: {signal_id})")
-            return signal_id
+        return signal_ids
 
     def record_signal_result(self, result: SignalResult):
         """სიგნალის შედეგი (როცა დაკეტო)"""
+        self.record_signal_results([result])
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE signal_results
-                SET
-                    actual_entry_price = ?,
-                    entry_time = ?,
-                    exit_price = ?,
-                    exit_time = ?,
-                    exit_reason = ?,
-                    profit_pct = ?,
-                    profit_usd = ?,
-                    days_held = ?,
-                    status = ?
-                WHERE signal_id = ?
-            """, (
-                result.actual_entry_price,
-                result.entry_time,
-                result.exit_price,
-                result.exit_time,
-                result.exit_reason,
-                result.profit_pct,
-                result.profit_usd,
-                result.days_held,
-                result.status.value,
-                result.signal_id
-            ))
+    def record_signal_results(self, results: List[SignalResult]):
+        """რამდენიმე შედეგი — ერთი executemany UPDATE, ერთი commit"""
+        if not results:
+            return
 
-            conn.commit()
+        with self._connect() as conn:
+            conn.executemany(_SQL_UPDATE_RESULT, [_result_row(r) for r in results])
+        self._stats_cache = (0.0, None)
 
+        for result in results:
             logger.info(
                 f"✅ Result recorded: {result.symbol} | "
                 f"{result.profit_pct:+.2f}% | {result.exit_reason}"
@@ -257,12 +417,8 @@ class SignalHistoryDB:
     def add_note(self, signal_id: int, note: str):
         """დამატებითი ჩანაწერი"""
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                UPDATE signal_results
-                SET notes = ?
-                WHERE signal_id = ?
-            """, (note, signal_id))
+        with self._connect() as conn:
+            conn.execute(_SQL_UPDATE_NOTE, (note, signal_id))
 
             conn.commit()
 
@@ -270,13 +426,28 @@ class SignalHistoryDB:
     # READ METHODS
     # ═══════════════════════════════════════════════════════════════════════
 
+    def _refresh_max_id(self, conn: sqlite3.Connection):
+        """MAX(id) — PK b-tree-ის ბოლო entry (lock-ის ქვეშ იძახება)"""
+        max_id = conn.execute("SELECT MAX(id) FROM sent_signals").fetchone()[0]
+        if max_id is not None:
+            self._max_known_id = max(self._max_known_id, max_id)
+
     def get_signal_with_result(self, signal_id: int) -> Optional[Dict]:
         """სიგნალი + შედეგი"""
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        # AUTOINCREMENT id 1-დან იწყება → 1-ზე ნაკლები ნამდვილად არ არსებობს
+        if signal_id < 1:
+            return None
 
-            cursor = conn.execute("""
+        with self._connect() as conn:
+            if signal_id > self._max_known_id:
+                self._refresh_max_id(conn)
+                if signal_id > self._max_known_id:
+                    return None
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row   # shared connection-ის row_factory არ იცვლება
+
+            cursor.execute("""
                 SELECT
                     s.*,
                     r.actual_entry_price,
@@ -295,40 +466,58 @@ class SignalHistoryDB:
             """, (signal_id,))
 
             row = cursor.fetchone()
-            return dict(row) if row else None
+            return self._public_row(row) if row else None
 
     def get_recent_signals(self, limit: int = 30) -> List[Dict]:
         """ბოლო N სიგნალი (რო გაიგზავნა)"""
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            cursor = conn.execute("""
-                SELECT
-                    s.id,
-                    s.symbol,
-                    s.strategy,
-                    s.entry_price,
-                    s.target_price,
-                    s.sent_time,
-                    s.confidence_score,
-                    r.status,
-                    r.profit_pct,
-                    r.exit_reason,
-                    r.days_held,
-                    r.notes
-                FROM sent_signals s
-                LEFT JOIN signal_results r ON s.id = r.signal_id
-                ORDER BY s.sent_time DESC
-                LIMIT ?
-            """, (limit,))
-
-            return [dict(row) for row in cursor.fetchall()]
+        # public API dict-ებს აბრუნებს (caller-ები .get()-ს იყენებენ)
+        with self._connect() as conn:
+            return [self._public_row(row) for row in self._recent_rows(conn, limit)]
+
+    @staticmethod
+    def _public_row(row: sqlite3.Row) -> Dict:
+        """Row → dict, status int → ძველი string label (None რჩება None)"""
+        d = dict(row)
+        d['status'] = _STATUS_LABEL.get(d['status'])
+        return d
+
+    @staticmethod
+    def _recent_rows(conn: sqlite3.Connection, limit: int) -> List[sqlite3.Row]:
+        """sqlite3.Row-ები პირდაპირ — შიდა caller-ებს dict-ის აგება არ სჭირდებათ"""
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row   # shared connection-ის row_factory არ იცვლება
+
+        cursor.execute("""
+            SELECT
+                s.id,
+                s.symbol,
+                s.strategy,
+                s.entry_price,
+                s.target_price,
+                s.sent_time,
+                s.confidence_score,
+                r.status,
+                r.profit_pct,
+                r.exit_reason,
+                r.days_held,
+                r.notes
+            FROM sent_signals s
+            LEFT JOIN signal_results r ON s.id = r.signal_id
+            ORDER BY s.sent_time DESC
+            LIMIT ?
+        """, (limit,))
+
+        return cursor.fetchall()
 
     def get_symbol_history(self, symbol: str) -> Dict:
-        """კონკრეტული symbol-ის ისტორია"""
+        """
+        კონკრეტული symbol-ის ისტორია. INNER JOIN — status NOT NULL-ია, ამიტომ
+        ძველი LEFT JOIN + "r.status IS NOT NULL" იგივე row-ებს იძლეოდა;
+        plan: idx_symbol → idx_results_signal_status (ორივე covering)
+        """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 SELECT
                     COUNT(*) as total,
@@ -338,8 +527,8 @@ class SignalHistoryDB:
                     MIN(r.profit_pct) as worst_trade,
                     SUM(r.profit_pct) as total_profit
                 FROM sent_signals s
-                LEFT JOIN signal_results r ON s.id = r.signal_id
-                WHERE s.symbol = ? AND r.status IS NOT NULL
+                JOIN signal_results r ON s.id = r.signal_id
+                WHERE s.symbol = ?
             """, (symbol,))
 
             row = cursor.fetchone()
@@ -359,7 +548,7 @@ class SignalHistoryDB:
     def get_strategy_performance(self, strategy: str) -> Dict:
         """სტრატეგიის performance"""
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("""
                 SELECT
                     COUNT(*) as total,
@@ -367,8 +556,8 @@ class SignalHistoryDB:
                     AVG(r.profit_pct) as avg_profit,
                     AVG(r.days_held) as avg_days
                 FROM sent_signals s
-                LEFT JOIN signal_results r ON s.id = r.signal_id
-                WHERE s.strategy = ? AND r.status IS NOT NULL
+                JOIN signal_results r ON s.id = r.signal_id
+                WHERE s.strategy = ?
             """, (strategy,))
 
             row = cursor.fetchone()
@@ -386,39 +575,42 @@ class SignalHistoryDB:
     def get_overall_stats(self) -> Dict:
         """მთლიანი სტატისტიკა"""
 
-        with sqlite3.connect(self.db_path) as conn:
-            # Total signals sent
-            cursor = conn.execute("SELECT COUNT(*) FROM sent_signals")
-            total_sent = cursor.fetchone()[0]
-
-            # Closed signals
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM signal_results WHERE status != ?"
-                "", (SignalStatus.SENT.value,)
-            )
-            total_closed = cursor.fetchone()[0]
-
-            # Results
-            cursor = conn.execute("""
-                SELECT
-                    SUM(CASE WHEN profit_pct > 0 THEN 1 ELSE 0 END) as wins,
-                    AVG(profit_pct) as avg_profit,
-                    SUM(profit_pct) as total_profit
-                FROM signal_results
-                WHERE status != ?
-            """, (SignalStatus.SENT.value,))
+        now = time.monotonic()
+        ts, cached = self._stats_cache
+        if cached is not None and now - ts < self.STATS_TTL:
+            return dict(cached)
+
+        with self._connect() as conn:
+            stats = self._overall_stats(conn)
+        self._stats_cache = (now, stats)
+        return dict(stats)
+
+    @staticmethod
+    def _overall_stats(conn: sqlite3.Connection) -> Dict:
+        # sent / closed / wins / avg / sum — ერთი conditional aggregation query
+        cursor = conn.execute("""
+            SELECT
+                COUNT(*) as total_sent,
+                SUM(CASE WHEN r.status != :sent THEN 1 ELSE 0 END) as total_closed,
+                SUM(CASE WHEN r.status != :sent AND r.profit_pct > 0 THEN 1 ELSE 0 END) as wins,
+                AVG(CASE WHEN r.status != :sent THEN r.profit_pct END) as avg_profit,
+                SUM(CASE WHEN r.status != :sent THEN r.profit_pct END) as total_profit
+            FROM sent_signals s
+            LEFT JOIN signal_results r ON s.id = r.signal_id
+        """, {"sent": SignalStatus.SENT.value})
+
+        total_sent, total_closed, wins, avg_profit, total_profit = cursor.fetchone()
+        total_closed = total_closed or 0
 
-            wins, avg_profit, total_profit = cursor.fetchone()
-
-            return {
-                'total_signals_sent': total_sent,
-                'total_signals_closed': total_closed,
-                'pending': total_sent - total_closed,
-                'wins': wins or 0,
-                'win_rate': (wins / total_closed * 100) if total_closed else 0,
-                'avg_profit_pct': avg_profit or 0,
-                'total_profit_pct': total_profit or 0
-            }
+        return {
+            'total_signals_sent': total_sent,
+            'total_signals_closed': total_closed,
+            'pending': total_sent - total_closed,
+            'wins': wins or 0,
+            'win_rate': (wins / total_closed * 100) if total_closed else 0,
+            'avg_profit_pct': avg_profit or 0,
+            'total_profit_pct': total_profit or 0
+        }
 
     # ═══════════════════════════════════════════════════════════════════════
     # REPORTING
@@ -427,31 +619,34 @@ class SignalHistoryDB:
     def generate_report(self) -> str:
         """დაწვრილებული რეპორტი"""
 
-        stats = self.get_overall_stats()
-        recent = self.get_recent_signals(limit=10)
+        # stats + ბოლო 10 — ერთი lock/connection call
+        with self._connect() as conn:
+            stats = self._overall_stats(conn)
+            recent = self._recent_rows(conn, 10)
 
-        report = "📊 **SIGNAL HISTORY REPORT**\n\n"
+        parts = ["📊 **SIGNAL HISTORY REPORT**\n\n"]
+        add = parts.append
 
         # Overall
-        report += f"**📈 მთლიანი:**\n"
-        report += f"• გაგზავნილი: {stats['total_signals_sent']}\n"
-        report += f"• დახურული: {stats['total_signals_closed']}\n"
-        report += f"• ელოდება: {stats['pending']}\n"
-        report += f"• Win Rate: {stats['win_rate']:.1f}%\n"
-        report += f"• საშუალო მოგება: {stats['avg_profit_pct']:+.2f}%\n"
-        report += f"• ჯამი: {stats['total_profit_pct']:+.2f}%\n\n"
+        add(f"**📈 მთლიანი:**\n")
+        add(f"• გაგზავნილი: {stats['total_signals_sent']}\n")
+        add(f"• დახურული: {stats['total_signals_closed']}\n")
+        add(f"• ელოდება: {stats['pending']}\n")
+        add(f"• Win Rate: {stats['win_rate']:.1f}%\n")
+        add(f"• საშუალო მოგება: {stats['avg_profit_pct']:+.2f}%\n")
+        add(f"• ჯამი: {stats['total_profit_pct']:+.2f}%\n\n")
 
         # Recent
-        report += "**📝 ბოლო 10 სიგნალი:**\n\n"
+        add("**📝 ბოლო 10 სიგნალი:**\n\n")
         for sig in recent:
             emoji = "✅" if (sig['profit_pct'] and sig['profit_pct'] > 0) else "❌"
             status = sig['status'] or "⏳"
             profit_str = f"{sig['profit_pct']:+.2f}%" if sig['profit_pct'] else "Pending"
 
-            report += f"{emoji} {sig['symbol']} ({sig['strategy']})\n"
-            report += f"   └─ {profit_str} | {sig['exit_reason'] or 'waiting'}\n"
+            add(f"{emoji} {sig['symbol']} ({sig['strategy']})\n")
+            add(f"   └─ {profit_str} | {sig['exit_reason'] or 'waiting'}\n")
 
-        return report
+        return "".join(parts)
 
     def get_dashboard_data(self) -> Dict:
         """დაშბორდის ამჟამინდელი მონაცემი"""
@@ -10,7 +10,6 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List, Dict, Tuple
-import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -180,7 +179,8 @@ class BaseStrategy(ABC):
             volume_score       * 0.15 +
             multi_tf_alignment * 0.10
         )
-        confidence_score = float(np.clip(confidence_score, 0, 100))
+        confidence_score = (0.0 if confidence_score < 0 else
+                            100.0 if confidence_score > 100 else float(confidence_score))
 
         if confidence_score >= 90:   level = ConfidenceLevel.VERY_HIGH
         elif confidence_score >= 75: level = ConfidenceLevel.HIGH
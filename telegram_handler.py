@@ -122,6 +122,8 @@ PAYMENT_INSTRUCTIONS = """💳 გამოწერის გააქტიუ
 
 GUIDE_FOOTER = "\n\n⚠️ DYOR — არ არის ფინანსური რჩევა. Always use Stop-Loss."
 
+SEND_RATE_PER_SEC = 30
+
 # ═══════════════════════════════════════════════════════════════════════════
 # TELEGRAM HANDLER v3.0 SAFE
 # ═══════════════════════════════════════════════════════════════════════════
@@ -162,6 +164,9 @@ class TelegramHandler:
         self._is_running = False
         self._start_lock = asyncio.Lock()
 
+        # Telegram bulk limit ~30 msg/sec — token ბრუნდება send-იდან 1 წამში
+        self._send_slots = asyncio.Semaphore(SEND_RATE_PER_SEC)
+
         logger.info("Telegram Handler v3.0 ready")
 
     # ═══════════════════════════════════════════════════════════════════════
@@ -877,14 +882,16 @@ Analytics:
         success = 0
         failed = 0
 
+        loop = asyncio.get_running_loop()
         for user_id in active_users:
+            await self._send_slots.acquire()
+            loop.call_later(1.0, self._send_slots.release)
             try:
                 await self.bot.send_message(
                     chat_id=user_id,
                     text=full_message
                 )
                 success += 1
-                await asyncio.sleep(0.05)
 
             except Exception as e:
                 failed += 1
@@ -48,7 +48,9 @@ from sell_signal_message_generator import SellSignalMessageGenerator
 logger = logging.getLogger(__name__)
 
 try:
-    from signal_history_db import SignalHistoryDB, SentSignal, SignalResult, SignalStatus
+    from signal_history_db import (
+        SignalHistoryDB, SentSignal, SignalResult, SignalStatus, _STATUS_LABEL,
+    )
     SIGNAL_HISTORY_AVAILABLE = True
 except Exception as e:
     SIGNAL_HISTORY_AVAILABLE = False
@@ -142,6 +144,8 @@ class DailySignalTracker:
 
 class TradingEngine:
 
+    PREFETCH_CHUNK = 16   # ~16×ASSET_DELAY scan-ის დრო — cache_ttl-ზე ბევრად ნაკლები
+
     def __init__(self):
         logger.info("🔧 TradingEngine v8.0 initializing...")
 
@@ -560,7 +564,7 @@ class TradingEngine:
                         )
                         logger.info(
                             f"✅ signal_history_db closed: {symbol} "
-                            f"{exit_analysis.profit_pct:+.2f}% ({status.value})"
+                            f"{exit_analysis.profit_pct:+.2f}% ({_STATUS_LABEL[status]})"
                         )
                 except Exception as e:
                     logger.warning(f"⚠️ signal_history_db sell update: {e}")
@@ -573,6 +577,19 @@ class TradingEngine:
 
     # ─── Market Scan ──────────────────────────────────────────────────────
 
+    async def _prefetch(self, symbols: List[str]):
+        """
+        Vectorized prefetch — indicators ერთი pass-ით, scan loop-ი fetch_data-ს cache-დან კითხულობს.
+        chunk-ებად loop-ის წინ: მთელი scan ASSET_DELAY-ით cache_ttl-ზე გრძელია და
+        ერთბაშად prefetch-ის ბოლო symbol-ები ხელახლა fetch-დებოდა.
+        """
+        try:
+            await self.data_provider.fetch_many(
+                [s for s in symbols if self._check_global_cooldown(s)[0]]
+            )
+        except Exception as e:
+            logger.error(f"❌ Prefetch failed: {e} — falling back to per-symbol fetch")
+
     async def scan_market(self, all_assets: List[str]):
         # ✅ P0/#1 — block scan until preload complete
         if self.data_provider and not self.data_provider.preload_complete:
@@ -597,14 +614,16 @@ class TradingEngine:
         success  = fail = generated = filtered = ai_rejected = sent = 0
         vol_blocked = global_cd = 0
 
-        for symbol in all_assets:
+        for i, symbol in enumerate(all_assets):
+            if i % self.PREFETCH_CHUNK == 0:
+                await self._prefetch(all_assets[i:i + self.PREFETCH_CHUNK])
             try:
                 # ✅ P1/#6 — global cooldown check
                 can_proceed, cd_reason = self._check_global_cooldown(symbol)
                 if not can_proceed:
                     global_cd += 1
                     self.stats["global_cooldown"] += 1
-                    logger.debug(f"⏭️ {symbol}: {cd_reason}")
+                    logger.debug("⏭️ %s: %s", symbol, cd_reason)
                     await asyncio.sleep(ASSET_DELAY)
                     continue
 
@@ -620,7 +639,7 @@ class TradingEngine:
                 # ✅ P0/#1 — real price history
                 price_history = self._get_price_history(symbol, 200)
                 if len(price_history) < 50:
-                    logger.debug(f"⚠️ {symbol}: insufficient history ({len(price_history)} pts) — skip")
+                    logger.debug("⚠️ %s: insufficient history (%d pts) — skip", symbol, len(price_history))
                     await asyncio.sleep(ASSET_DELAY)
                     continue
 
@@ -633,7 +652,7 @@ class TradingEngine:
                 # ✅ P1/#4 — pass real multi-TF data to structure builder
                 multi_tf = data.get("_multi_tf")
                 market_structure = self.structure_builder.build(
-                    symbol, price, data, regime, list(price_history),
+                    symbol, price, data, regime, price_history,
                     multi_tf=multi_tf  # new kwarg (builder handles None gracefully)
                 )
 
@@ -676,14 +695,14 @@ class TradingEngine:
                     if "volume" in reason.lower():
                         vol_blocked += 1
                     filtered += 1
-                    logger.debug(f"⏭️ {symbol}: {reason}")
+                    logger.debug("⏭️ %s: %s", symbol, reason)
                     await asyncio.sleep(ASSET_DELAY)
                     continue
 
                 if best_strategy:
                     should_send, s_reason = best_strategy.should_send_signal(symbol, best_signal)
                     if not should_send:
-                        logger.debug(f"⏭️ {symbol}: Cooldown")
+                        logger.debug("⏭️ %s: Cooldown", symbol)
                         await asyncio.sleep(ASSET_DELAY)
                         continue
 